@@ -61,7 +61,7 @@ from typing import Any
 from itertools import zip_longest
 import logging
 
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.platypus import Paragraph
 from reportlab import rl_config
 
@@ -71,6 +71,7 @@ from kanji_time.adapter.svg import DrawingForRL, RLDrawing, ReportLabDrawingFact
 from kanji_time.external_data import kanji_dic2 as kanji_dict2, kanji_dict
 from kanji_time.external_data.kanji_svg import KanjiSVG
 from kanji_time.external_data.radicals import Radical
+from kanji_time.visual.frame._styles import SAMPLE_STYLES
 from kanji_time.visual.layout.region import Extent
 
 
@@ -414,9 +415,9 @@ def build_data_object(glyph: str, size: Extent) -> KanjiReportData:
 
     styles = {
         # persist this in an options thingy somewhere & load it at runtime instead of hardcoding.
-        'Normal': getSampleStyleSheet()['Normal'],
-        'Heading1': getSampleStyleSheet()['Heading1'],
-        'Heading2': getSampleStyleSheet()['Heading2'],
+        'Normal': SAMPLE_STYLES['Normal'],
+        'Heading1': SAMPLE_STYLES['Heading1'],
+        'Heading2': SAMPLE_STYLES['Heading2'],
         'English Title': ParagraphStyle(
             'English Title',
             alignment=1, fontName='Helvetica-Bold', fontSize=14, leading=17
@@ -127,7 +127,7 @@ class KanjiSummary(SimpleElement):
         self._requested_size = Extent(  # yuck!  Re-init?  Defer init?  Touching privates without permission is a no-no.
             Distance.fit_to,
             max(heading_height + heading_pad + body_height, self.requested_size.height)
-        )
+        ) or Extent.fit_to
         self.content_size = heading_height + heading_pad + body_height
         return
 
@@ -55,13 +55,13 @@ from typing import cast
 
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import Paragraph
 
 import kanji_time.settings as settings
 # Review the adapter nomenclature conventions: adapter.SVGtoRL.Drawing, RLtoSVG.Drawing ?
 from kanji_time.reports.practice_sheet.document import PracticeSheetData
 from kanji_time.reports.controller import PageLayout, PageLayoutName, PaginatedReport, DelegatingRenderingFrame
+from kanji_time.visual.frame._styles import NORMAL_STYLE
 from kanji_time.visual.frame.drawing import ReportLabDrawing
 from kanji_time.visual.frame.formatted_text import FormattedText
 from kanji_time.visual.frame.page import Page
@@ -175,7 +175,7 @@ class Report(PaginatedReport, DelegatingRenderingFrame):
         self.report_data = report_data
         steps = len(report_data.glyph_svg.strokes) + 1
 
-        normal_style = getSampleStyleSheet()['Normal']
+        normal_style = NORMAL_STYLE
 
         # Review: what are all the failure modes?  I have no edge case handling!
         max_columns = (page_size.width // self.CELL_SIZE)  # + int((page_size.width % self.CELL_SIZE) > 0)
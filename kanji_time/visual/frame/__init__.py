@@ -60,5 +60,18 @@ These provide specific rendering logic for formatted text, vector graphics, hori
    page_rule.py <page_rule.py>
    empty_space.py <empty_space.py>
 
+
+ReportLab Shape Checking
+------------------------
+
+ReportLab validates every attribute assignment on its graphics shapes when ``rl_config.shapeChecking`` is on.
+That catches mistakes while developing, but costs a few dozen checks per constructed object.
+Optimized runs (``python -O``) turn the checks off for the whole process when this package is imported;
+regular runs and the test suite keep them.
+
 """
 
+if not __debug__:
+    from reportlab import rl_config
+    rl_config.shapeChecking = 0
+
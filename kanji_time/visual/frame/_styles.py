@@ -0,0 +1,21 @@
+# _styles.py
+# Copyright (C) 2024, 2025 Andrew Milton
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Share one ReportLab sample style sheet across all frame content.
+
+getSampleStyleSheet() builds a fresh style sheet on every call.
+Build it once here and import the styles instead.
+
+.. caution:: These styles are shared - derive a new ParagraphStyle instead of modifying them in place.
+
+----
+
+"""
+
+from reportlab.lib.styles import getSampleStyleSheet
+
+
+SAMPLE_STYLES = getSampleStyleSheet()
+NORMAL_STYLE = SAMPLE_STYLES['Normal']
@@ -41,6 +41,7 @@ logger = logging.getLogger(__name__)
 
 ReservedArea = namedtuple('ReservedArea', "element region")
 
+
 class Container(RenderingFrame):
     """
     Model an interior element on the content tree - a "container" in the sense that owns child content.
@@ -133,7 +134,7 @@ class Container(RenderingFrame):
         """
         # These are required by the protocol
         self._state = States.new
-        self._requested_size = requested_size
+        self._requested_size = requested_size or Extent.fit_to
         self._layout_size = requested_size
         self.content_size = Extent.zero
 
@@ -348,7 +349,7 @@ class Container(RenderingFrame):
                 assert new_extent in extent, f"new_extent {new_extent} == {self.sizes[i]} + {leftover} not in extent = {extent}"
                 revised_extent = element.measure(new_extent)
                 # Review:  not quite right, what about page overflow?  Handle with an exception? Implies a smart distance accumulator?
-                new_extent.conditional_replace(operator.__lt__, **revised_extent._asdict())
+                new_extent.replace_width_if(operator.__lt__, revised_extent.width).replace_height_if(operator.__lt__, revised_extent.height)
                 # new extent is exactly what you get!
                 # Review: could I try to shuffle more slop around if <element> wants more space.
                 self.sizes[i] = new_extent  # revised_extent == element.measure(new_extent)
@@ -21,6 +21,7 @@ Model a block of text represented in a ReportLab paragraph set.
 
 # pylint: disable=fixme
 
+from collections import namedtuple
 from collections.abc import Sequence
 import logging
 from typing import cast
@@ -30,13 +31,19 @@ from reportlab.platypus import Paragraph, Frame, Flowable
 from kanji_time.visual.frame.simple_element import SimpleElement
 from kanji_time.visual.layout.anchor_point import AnchorPoint
 from kanji_time.visual.layout.distance import Distance
-from kanji_time.visual.layout.region import Region, Extent
+from kanji_time.visual.layout.region import Region, Extent, Pos
 from kanji_time.visual.protocol.content import DisplaySurface, States
 
 
 logger = logging.getLogger(__name__)
 
 
+# Width-independent measurements of one flowable - taken once per text content by FormattedText._prepare().
+# wrapped_heights memoizes the flowable's wrapped height by the exact (width, height) in points it was measured into.
+_PreparedText = namedtuple("_PreparedText", "text min_width natural_width natural_height space_before space_after wrapped_heights")
+_UNBOUNDED_PT = 1.0e6  # wide enough that no paragraph wraps
+
+
 class FormattedText(SimpleElement):
     """
     A container for text contained a sequence of ReportLab paragraphs that may include formatting.
@@ -96,14 +103,49 @@ class FormattedText(SimpleElement):
         """Initialize the content with a dummy SVG and the dummy text."""
         super().__init__(requested_size)
         self.anchor = anchor
+        self._anchor_factors = anchor.factors()  # the anchor is fixed, so its placement factors are too
         self.text: Sequence[Flowable] = text
         self.content_size = Extent.zero
         self.do_not_consume = do_not_consume
+        self._prepared: list[_PreparedText] | None = None
+        self._content_width = 0.0  # widest unwrapped flowable, in points
+        self._spacing = 0.0  # inter-paragraph spacing, in points
+        self._unwrapped_height = 0.0  # text height when nothing wraps, in points
+        self._cache_spacing()
 
     def __bool__(self) -> bool:
         """Produce true when this rendering frame has non-trivial content."""
         return bool(self.text)
 
+    def _prepare(self) -> list[_PreparedText]:
+        """
+        Take the width-independent measurements of the text once per text content.
+
+        Each flowable is wrapped once into unbounded space to learn its natural (unwrapped) width and height.
+        Any later measurement at least that wide yields the same height, so measure() only asks ReportLab to re-wrap narrower paragraphs.
+
+        :return: the prepared measurements for each flowable in the text.
+        """
+        if self._prepared is None:
+            prepared = []
+            for text in self.text:
+                natural_width, natural_height = text.wrap(_UNBOUNDED_PT, _UNBOUNDED_PT)
+                if isinstance(text, Paragraph):
+                    # A paragraph claims all of the width it is offered - use its widest line plus indents instead.
+                    style = text.style
+                    natural_width = (
+                        max(text.getActualLineWidths0(), default=0.0) +
+                        style.leftIndent + style.rightIndent + max(style.firstLineIndent, 0)
+                    )
+                prepared.append(_PreparedText(
+                    text, text.minWidth(), natural_width, natural_height, text.getSpaceBefore(), text.getSpaceAfter(), {}
+                ))
+            self._prepared = prepared
+            self._content_width = max((text.natural_width for text in prepared), default=0.0)
+            self._spacing = sum(text.space_after for text in prepared[:-1]) + sum(text.space_before for text in prepared[1:])
+            self._unwrapped_height = sum(text.natural_height for text in prepared) + self._spacing
+        return self._prepared
+
     def measure(self, extent: Extent) -> Extent:
         """
         Measure the minimum size of the element.
@@ -132,6 +174,11 @@ class FormattedText(SimpleElement):
         if not extent:
             # Force zero on both axes
             extent = Extent.zero
+        if not self.text:
+            # Nothing to measure - don't go near ReportLab.
+            self.content_size = Extent.zero
+            return self.requested_size | extent  # revised from minimum_size
+
         # revised this.
         # minimum_size = self.requested_size | extent  # | => Extent union operator
         assert extent is not None
@@ -140,40 +187,61 @@ class FormattedText(SimpleElement):
             max(self.requested_size.width, extent.width),   # we're fitting to width, so we need as much space as offered.
             min(self.requested_size.height, extent.height)  # don't want to overflow unless we measure it so explicitly
         )
-        if not self.text:
-            self.content_size = Extent.zero
-            return self.requested_size | extent  # revised from minimum_size
 
+        prepared = self._prepare()
         text_width = max(
-            Distance(max(text.minWidth() for text in self.text), "pt", at_least=True),  # type: ignore
+            Distance(max(text.min_width for text in prepared), "pt", at_least=True),  # type: ignore
             minimum_size.width
         )
         text_height = minimum_size.height
 
         # Get the height of each paragraph and the inter-paragraph spacing.
         # Paragraph.wrap() seems to ignore the passed height
-        text_height_float = sum(text.wrap(float(text_width.pt), float(text_height.pt))[1] for text in self.text)
-        text_after_float = sum(text.getSpaceAfter() for text in self.text[:-1])
-        text_before_float = sum(text.getSpaceBefore() for text in self.text[1:])
+        width_pt, height_pt = float(text_width.pt), float(text_height.pt)
+        if width_pt >= self._content_width:
+            # Resize to fit: nothing wraps at this width, so the height is the one already taken by _prepare().
+            text_height_float = self._unwrapped_height
+        else:
+            # Paragraphs that fit unwrapped keep their natural height - only the narrower ones go back to ReportLab.
+            text_height_float = self._spacing + sum(
+                text.natural_height if width_pt >= text.natural_width else self._wrapped_height(text, width_pt, height_pt)
+                for text in prepared
+            )
 
         # save the total text height to position the origin in our draw region
-        total_text_height = Distance(
-            text_height_float + text_after_float + text_before_float + self.height_extra, "pt",   # type: ignore
-            at_least=True
-        )
+        total_text_height = Distance(text_height_float + self.height_extra, "pt", at_least=True)  # type: ignore
         self.content_size = Extent(text_width, total_text_height)
 
         # Now return the union of the computed size and the minimum size.
         # Review -> why do I need the passed extent??
         return super().measure(self.requested_size | self.content_size)  # removed:  | extent # revised from minimum_size | self.text_extent
 
+    @staticmethod
+    def _wrapped_height(text: _PreparedText, width_pt: float, height_pt: float) -> float:
+        """
+        Measure the height of one prepared flowable wrapped into a given space.
+
+        ReportLab's wrap() is the hot spot when measuring text, and layout measures the same text into the same space many times over.
+        The sizes are exact: the text must be measured at the width it is drawn at, or a rounded-up width can miss a wrap.
+        """
+        key = (width_pt, height_pt)
+        height = text.wrapped_heights.get(key)
+        if height is None:
+            height = text.wrapped_heights[key] = text.text.wrap(width_pt, height_pt)[1]
+        return height
+
+    def _cache_spacing(self) -> None:
+        """Record the spacing around my paragraphs-as-a-unit - it only changes when drawing consumes text."""
+        self._space_before = self.text[0].getSpaceBefore() if self.text else 0
+        self._space_after = self.text[-1].getSpaceBefore() if self.text else 0
+
     def getSpaceBefore(self) -> float:  # pylint: disable=invalid-name
         """Provide ReportLab Flowable attribute for space before my paragraphs-as-a-unit."""
-        return self.text[0].getSpaceBefore() if self.text else 0
+        return self._space_before
 
     def getSpaceAfter(self) -> float:  # pylint: disable=invalid-name
         """Provide ReportLab Flowable attribute for space after my paragraphs-as-a-unit."""
-        return self.text[-1].getSpaceBefore() if self.text else 0
+        return self._space_after
 
     def do_layout(self, target_extent: Extent) -> Region:
         """
@@ -189,7 +257,12 @@ class FormattedText(SimpleElement):
             logger.warning("Not enough space to render all text.  Trimming")
             self.content_size = self.content_size & target_extent
             # raise ValueError("Expected enough space to draw the text!")
-        origin = self.content_size.anchor_at(self.anchor, target_extent)
+        # Same placement as Extent.anchor_at() with my anchor's factors looked up once at initialization.
+        fx, fy = self._anchor_factors
+        origin = Pos(
+            (target_extent.width - self.content_size.width) * fx if fx else Distance.zero,
+            (target_extent.height - self.content_size.height) * fy if fy else Distance.zero
+        )
         return Region(origin, self.content_size)
 
     def draw(self, c: DisplaySurface, region: Region) -> None:
@@ -250,6 +323,12 @@ class FormattedText(SimpleElement):
 
         """
         state = States.all_data_consumed
+        if not self.text:
+            # Nothing to draw - skip building a ReportLab frame for it.
+            if self.do_not_consume:
+                state |= States.reusable
+            self._state = States.drawn | state
+            return
         (content_x, content_y), (content_width, content_height) = region.origin, region.extent
         text_frame = Frame(
             content_x.pt, content_y.pt, content_width.pt, content_height.pt,
@@ -261,6 +340,9 @@ class FormattedText(SimpleElement):
         if self.do_not_consume:
             drawlist = list(drawlist)
         text_frame.addFromList(drawlist, c)
+        if not self.do_not_consume:
+            self._prepared = None  # the drawn text is gone - prepare the remainder afresh
+            self._cache_spacing()
         if drawlist:
             logging.warning("NOT rendered\n\t%s", "\n\t".join(cast(Paragraph, t).getPlainText() for t in drawlist))
             # use the remaining drawlist for the next page if we've got one.
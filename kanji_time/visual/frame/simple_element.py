@@ -69,7 +69,7 @@ class SimpleElement(RenderingFrame):
 
     def __init__(self, size: Extent):
         """Initialize a simple element with its declared size."""
-        self._requested_size = size
+        self._requested_size = size or Extent.fit_to
         self._layout_size = size
         self._state = States.new
 
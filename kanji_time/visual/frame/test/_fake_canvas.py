@@ -0,0 +1,29 @@
+# _fake_canvas.py
+# Copyright (C) 2024, 2025 Andrew Milton
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+A lightweight stand-in for a ReportLab canvas in draw tests.
+
+MagicMock builds a child mock for every attribute touched, which is slow when draw is exercised often.
+FakeCanvas just records each method call in order.
+
+.. caution:: Every method returns None - use a real canvas (or a mock) for code that consumes canvas return values, such as
+             ReportLab's Frame and renderPDF.
+"""
+
+
+class FakeCanvas:
+    """Record every method call made on a display surface as a (name, args, kwargs) triple."""
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name):
+        """Produce a recorder for any canvas method."""
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def calls_to(self, name: str) -> list[tuple[tuple, dict]]:
+        """Produce the (args, kwargs) of each call to the named method in call order."""
+        return [(args, kwargs) for called, args, kwargs in self.calls if called == name]
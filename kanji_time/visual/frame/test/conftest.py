@@ -0,0 +1,36 @@
+# conftest.py
+# Copyright (C) 2024, 2025 Andrew Milton
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+PyTest fixtures for frame testing.
+
+Building a ReportLab Paragraph parses its markup and processes its style, so the suite shares one Paragraph per distinct input.
+Paragraph *lists* are still built per test: FormattedText consumes its list when it draws.
+"""
+
+import functools
+
+import pytest
+from reportlab.platypus import Paragraph
+
+from kanji_time.visual.frame._styles import NORMAL_STYLE
+
+
+@pytest.fixture(scope='session')
+def normal_style():
+    """The shared ReportLab 'Normal' paragraph style."""
+    return NORMAL_STYLE
+
+
+@pytest.fixture(scope='session')
+def make_para(normal_style):  # pylint: disable=redefined-outer-name
+    """
+    Factory for Paragraphs in the normal style set in a given typeface.
+
+    Call as make_para(text, font_name='Helvetica') - identical calls yield the same Paragraph instance.
+    """
+    @functools.lru_cache(maxsize=256)
+    def factory(text: str, font_name: str = 'Helvetica') -> Paragraph:
+        return Paragraph(f'<font name="{font_name}">{text}</font>', style=normal_style)
+    return factory
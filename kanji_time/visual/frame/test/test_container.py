@@ -13,6 +13,11 @@ from kanji_time.visual.layout.region import Extent, Region, Pos
 from kanji_time.visual.layout.distance import Distance
 from kanji_time.visual.protocol.content import States, RenderingFrame
 from kanji_time.visual.protocol.layout_strategy import LayoutStrategy
+from kanji_time.visual.frame.test._fake_canvas import FakeCanvas
+
+
+# Distance instances are immutable and interned - share the common literals across the suite.
+_D0, _D5, _D10, _D15, _D20, _D30 = (Distance(v, "cm") for v in (0, 5, 10, 15, 20, 30))
 
 
 # MOCK Setup ------------------------------------------------------------------------------------------------------------------------------- #
@@ -21,13 +26,13 @@ from kanji_time.visual.protocol.layout_strategy import LayoutStrategy
 def create_mock_child(state=States.ready, stretchy_width=False, stretchy_height=False, data_state=States.new):
     """Helper to create a mock child RenderingFrame."""
     mock_child = MagicMock(spec=RenderingFrame)
-    mock_child.measure.return_value = Extent(Distance(10, "cm"), Distance(5, "cm"))
+    mock_child.measure.return_value = Extent(_D10, _D5)
     mock_child.state = state
 
     def measure_side_effect(*args, **kwargs):
         """Transition state to needs_layout upon measure call."""
         mock_child.state = States.needs_layout
-        return Extent(Distance(10, "cm"), Distance(5, "cm"))
+        return Extent(_D10, _D5)
 
     mock_child.measure.side_effect = measure_side_effect
 
@@ -39,37 +44,49 @@ def create_mock_child(state=States.ready, stretchy_width=False, stretchy_height=
     def do_layout_side_effect(*args, **kwargs):
         """Transition state to ready upon do_layout call."""
         mock_child.state = States.ready
-        return Region(Pos(Distance(0, "cm"), Distance(0, "cm")), Extent(Distance(20, "cm"), Distance(10, "cm")))
+        return Region(Pos(_D0, _D0), Extent(_D20, _D10))
 
     mock_child.do_layout.side_effect = do_layout_side_effect
 
 
     mock_child.is_stretchy = MagicMock(width=stretchy_width, height=stretchy_height)
-    mock_child.do_layout.return_value = Region(Pos(Distance(0, "cm"), Distance(0, "cm")), Extent(Distance(10, "cm"), Distance(5, "cm")))
+    mock_child.do_layout.return_value = Region(Pos(_D0, _D0), Extent(_D10, _D5))
     return mock_child
 
-def create_mock_layout_strategy(stretchy: bool = False):
-    """Helper to create a mock LayoutStrategy."""
-    mock_strategy = MagicMock(spec=LayoutStrategy)
-    mock_strategy.measure.return_value = Extent(Distance(20 + 10*(int(stretchy)), "cm"), Distance(10 + 5*int(stretchy), "cm"))
-
-    # Set return_value directly since MagicMock instances are callable by default
-    mock_strategy.layout.return_value = (
-        Extent(Distance(20 + 10*(int(stretchy)), "cm"), Distance(10 + 5*int(stretchy), "cm")),
+# Canned layout strategy results - Distance, Extent, and Region are immutable so each variant is built once at import.
+_MEASURE_RET = {
+    stretchy: Extent(Distance(20 + 10*(int(stretchy)), "cm"), Distance(10 + 5*int(stretchy), "cm"))
+    for stretchy in (False, True)
+}
+_LAYOUT_RET = {
+    stretchy: (
+        _MEASURE_RET[stretchy],
         [
             Region(
-                Pos(Distance(0, "cm"), Distance(0, "cm")),
+                Pos(_D0, _D0),
                 Extent(Distance(10 + 10*int(stretchy), "cm"), Distance(5 + 5*int(stretchy), "cm"))
             ),
-            Region(Pos(Distance(10, "cm"), Distance(0, "cm")), Extent(Distance(10, "cm"), Distance(5, "cm")))
+            Region(Pos(_D10, _D0), Extent(_D10, _D5))
         ]
     )
+    for stretchy in (False, True)
+}
+
+
+def create_mock_layout_strategy(stretchy: bool = False):
+    """Helper to create a mock LayoutStrategy."""
+    mock_strategy = MagicMock(spec=LayoutStrategy)
+    mock_strategy.measure.return_value = _MEASURE_RET[stretchy]
+
+    # Set return_value directly since MagicMock instances are callable by default
+    mock_strategy.layout.return_value = _LAYOUT_RET[stretchy]
     return mock_strategy
 
 
 # Content Frame Container Frame Tests ------------------------------------------------------------------------------------------------------ #
 
 
+@pytest.mark.fast
 def test_container_initialization():
     """
     Test initializing a Container instance with child elements.
@@ -84,13 +101,14 @@ def test_container_initialization():
         "child2": create_mock_child()
     }
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("TestContainer", size, child_elements, layout_strategy)
     assert container.element_name == "TestContainer"
     assert container.layout_strategy == layout_strategy
     assert len(container.child_elements) == 2
 
 
+@pytest.mark.fast
 def test_child_elements_immutable():
     """
     Test immutability of child_elements property.
@@ -100,7 +118,7 @@ def test_child_elements_immutable():
     """
     child_elements = {"child1": create_mock_child()}
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("ImmutableTest", size, child_elements, layout_strategy)
     with pytest.raises(TypeError):
         container.child_elements["child2"] = create_mock_child()  # type: ignore
@@ -117,7 +135,7 @@ def test_measure_children():
         "child2": create_mock_child()
     }
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("MeasureTest", size, child_elements, layout_strategy)
     measured_extent = container.measure(size)
     assert measured_extent == size
@@ -135,11 +153,11 @@ def test_stretchy_child_measurement():
         "child2": create_mock_child(stretchy_height=True)
     }
     layout_strategy = create_mock_layout_strategy(stretchy=True)
-    size = Extent(Distance(30, "cm"), Distance(15, "cm"))
+    size = Extent(_D30, _D15)
     container = Container("StretchTest", size, child_elements, layout_strategy)
     measured_extent = container.measure(size)
-    assert measured_extent.width == Distance(30, "cm")
-    assert measured_extent.height == Distance(15, "cm")
+    assert measured_extent.width == _D30
+    assert measured_extent.height == _D15
 
 
 def test_layout_allocation():
@@ -155,7 +173,7 @@ def test_layout_allocation():
         "child2": create_mock_child()
     }
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("LayoutTest", size, child_elements, layout_strategy)
     container.measure(size)
     region = container.do_layout(size)
@@ -174,54 +192,38 @@ def test_draw_container():
         "child2": create_mock_child()
     }
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("DrawTest", size, child_elements, layout_strategy)
     container.measure(size)
     container.do_layout(size)
-    mock_canvas = MagicMock()
-    region = Region(Pos(Distance(0, "cm"), Distance(0, "cm")), size)
-    container.draw(mock_canvas, region)
+    region = Region(Pos(_D0, _D0), size)
+    container.draw(FakeCanvas(), region)
     assert container.state == States.drawn
 
 
-def test_draw_onepage_data():
-    """Test drawing child elements inside container."""
-    child_elements = {
-        "child1": create_mock_child(data_state=States.all_data_consumed),
-        "child2": create_mock_child()
-    }
-    layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
-    container = Container("DrawTest", size, child_elements, layout_strategy)
-    container.measure(size)
-    container.do_layout(size)
-    mock_canvas = MagicMock()
-    region = Region(Pos(Distance(0, "cm"), Distance(0, "cm")), size)
-    container.draw(mock_canvas, region)
-    assert container.state == States.drawn | States.all_data_consumed
-    new_page_waiting = container.begin_page(2)
-    assert not new_page_waiting
-    assert container.state == States.drawn | States.all_data_consumed
-
-
-def test_draw_multipage_data():
-    """Test drawing child elements inside container."""
+@pytest.mark.parametrize("data_state, new_page_waiting", [
+    (States.all_data_consumed, False),
+    (States.have_more_data, True),
+])
+def test_draw_paged_data(data_state, new_page_waiting):
+    """Test drawing child elements inside container for one page and multipage child data."""
     child_elements = {
-        "child1": create_mock_child(data_state=States.have_more_data),
+        "child1": create_mock_child(data_state=data_state),
         "child2": create_mock_child()
     }
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("DrawTest", size, child_elements, layout_strategy)
     container.measure(size)
     container.do_layout(size)
-    mock_canvas = MagicMock()
-    region = Region(Pos(Distance(0, "cm"), Distance(0, "cm")), size)
-    container.draw(mock_canvas, region)
-    assert container.state == States.drawn | States.have_more_data
-    new_page_waiting = container.begin_page(2)
-    assert new_page_waiting
-    assert container._state == States.waiting
+    region = Region(Pos(_D0, _D0), size)
+    container.draw(FakeCanvas(), region)
+    assert container.state == States.drawn | data_state
+    assert container.begin_page(2) == new_page_waiting
+    if new_page_waiting:
+        assert container._state == States.waiting
+    else:
+        assert container.state == States.drawn | data_state
 
 
 def test_state_aggregation():
@@ -239,13 +241,14 @@ def test_state_aggregation():
         "child2": create_mock_child(state=States.drawn | States.have_more_data)
     }
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("StateTest", size, child_elements, layout_strategy)
     state = container.state
     assert state & States.have_more_data
     assert state & States.reusable
 
 
+@pytest.mark.fast
 def test_no_child_elements():
     """
     Test container with no child elements.
@@ -253,7 +256,7 @@ def test_no_child_elements():
     REQ:  Measuring an empty container yields its requested size.
     """
     layout_strategy = create_mock_layout_strategy()
-    size = Extent(Distance(20, "cm"), Distance(10, "cm"))
+    size = Extent(_D20, _D10)
     container = Container("EmptyTest", size, {}, layout_strategy)
     measured_extent = container.measure(size)
     assert measured_extent == size
@@ -267,18 +270,19 @@ def test_no_child_elements():
 #         "child2": create_mock_child()
 #     }
 #     layout_strategy = create_mock_layout_strategy()
-#     size = Extent(Distance(10, "cm"), Distance(5, "cm"))  # Smaller space
+#     size = Extent(_D10, _D5)  # Smaller space
 #     container = Container("ExceedTest", size, child_elements, layout_strategy)
 #     with pytest.raises(ValueError):
 #         container.measure(size)
 
 
+@pytest.mark.fast
 def test_update_add_new_frame():
     """
     REQ: The `update()` method adds new frames if not already present in the layout.
     """
     layout_strategy = create_mock_layout_strategy()
-    container = Container("UpdateAdd", Extent(Distance(20, "cm"), Distance(10, "cm")), {}, layout_strategy)
+    container = Container("UpdateAdd", Extent(_D20, _D10), {}, layout_strategy)
 
     new_frame = create_mock_child()
     updated = container.update({"new": new_frame})
@@ -287,6 +291,7 @@ def test_update_add_new_frame():
     assert updated["new"] is new_frame
 
 
+@pytest.mark.fast
 def test_update_replace_existing_frame():
     """
     REQ: The `update()` method replaces an existing frame if the instance is different.
@@ -295,7 +300,7 @@ def test_update_replace_existing_frame():
     replacement_frame = create_mock_child()
 
     layout_strategy = create_mock_layout_strategy()
-    container = Container("UpdateReplace", Extent(Distance(20, "cm"), Distance(10, "cm")),
+    container = Container("UpdateReplace", Extent(_D20, _D10),
                           {"frame": original_frame}, layout_strategy)
 
     updated = container.update({"frame": replacement_frame})
@@ -304,13 +309,14 @@ def test_update_replace_existing_frame():
     assert updated["frame"] is replacement_frame
 
 
+@pytest.mark.fast
 def test_update_ignores_identical_instance():
     """
     REQ: The `update()` method preserves the existing instance if it is the same.
     """
     frame = create_mock_child()
     layout_strategy = create_mock_layout_strategy()
-    container = Container("UpdateSame", Extent(Distance(20, "cm"), Distance(10, "cm")),
+    container = Container("UpdateSame", Extent(_D20, _D10),
                           {"frame": frame}, layout_strategy)
 
     updated = container.update({"frame": frame})
@@ -320,13 +326,14 @@ def test_update_ignores_identical_instance():
     assert updated["frame"] is frame
 
 
+@pytest.mark.fast
 def test_update_removes_named_frame():
     """
     REQ: The `update()` method removes a named frame if its value is None.
     """
     frame = create_mock_child()
     layout_strategy = create_mock_layout_strategy()
-    container = Container("UpdateRemove", Extent(Distance(20, "cm"), Distance(10, "cm")),
+    container = Container("UpdateRemove", Extent(_D20, _D10),
                           {"delete_me": frame}, layout_strategy)
 
     updated = container.update({"delete_me": None})
@@ -334,6 +341,7 @@ def test_update_removes_named_frame():
     assert "delete_me" not in updated
 
 
+@pytest.mark.fast
 def test_update_combined_add_remove():
     """
     REQ: The `update()` method supports simultaneous add/remove operations.
@@ -341,7 +349,7 @@ def test_update_combined_add_remove():
     keep = create_mock_child()
     remove = create_mock_child()
     layout_strategy = create_mock_layout_strategy()
-    container = Container("UpdateMixed", Extent(Distance(20, "cm"), Distance(10, "cm")),
+    container = Container("UpdateMixed", Extent(_D20, _D10),
                           {"remove_me": remove, "keep_me": keep}, layout_strategy)
 
     new = create_mock_child()
@@ -59,6 +59,7 @@ def test_measure_with_drawing():
     assert measured_extent.height >= Distance(200, "pt")
     assert element.state == States.needs_layout
 
+@pytest.mark.fast
 def test_measure_without_drawing():
     """
     Test measure falls back to minimum size when drawing is None.
@@ -6,8 +6,8 @@
 
 import pytest
 from unittest.mock import MagicMock
+
 from reportlab.platypus import Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
 
 from kanji_time.visual.frame.formatted_text import FormattedText
 from kanji_time.visual.layout.region import Extent, Region, Pos
@@ -19,16 +19,53 @@ from kanji_time.visual.protocol.content import States
 # ReportLab Text Paragraph Tests ----------------------------------------------------------------------------------------------------------- #
 
 
-styles = getSampleStyleSheet()
-normal_style = styles['Normal']
+# Most tests only need some text - share one string so make_para hands every test the same parsed Paragraph.
+TEST_TEXT = "Test test\ntest"
+
+# Measurement tests offer a small width and a tall height so the offered width alone decides where the text wraps.
+_TALL_PT = 1000
+# ReportLab wraps this one at 67.661pt: just under a 0.1pt step, so a width rounded to 0.1pt lands on the wrong side of the wrap.
+_SHORT_TEXT = "First paragraph"
+_LONG_TEXT = "A longer paragraph that keeps going well past the width of the short one before it ends"
 
 
-def in_typeface(font_name, text):
-    """Helper function to apply a typeface (font) to a given text."""
-    return f'<font name="{font_name}">{text}</font>'
+def _wrapped_text_height(text: list[Paragraph], width_pt: float) -> float:
+    """The height ReportLab wraps <text> to at exactly <width_pt>, with the inter-paragraph spacing FormattedText adds."""
+    return (
+        sum(para.wrap(width_pt, _TALL_PT)[1] for para in text) +
+        sum(para.getSpaceAfter() for para in text[:-1]) + sum(para.getSpaceBefore() for para in text[1:])
+    )
 
 
-def test_formatted_text_initialization():
+def _edge_width(para: Paragraph, edge: str) -> float:
+    """
+    Find the width where <para> changes how it measures.
+
+    The "natural" edge is the width of its widest line when nothing wraps.
+    The "wrap" edge is the narrowest width ReportLab fits it on one line at - a little less than natural, as ReportLab allows a small overhang.
+    """
+    one_line = para.wrap(_TALL_PT * 1000, _TALL_PT)[1]
+    natural = max(para.getActualLineWidths0())
+    if edge == "natural":
+        return natural
+    wraps, fits = 0.0, natural
+    while fits - wraps > 1e-6:
+        middle = (wraps + fits)/2
+        if para.wrap(middle, _TALL_PT)[1] > one_line:
+            wraps = middle
+        else:
+            fits = middle
+    return fits
+
+
+def _measured_text(element: FormattedText, width_pt: float) -> tuple[float, float]:
+    """Measure <element> into <width_pt> and produce the width it measured at and its text height, both in points."""
+    element.measure(Extent(Distance(width_pt, "pt"), Distance(_TALL_PT, "pt")))
+    width, height = element.content_size
+    return float(width.pt), float(height.pt) - element.height_extra
+
+
+def test_formatted_text_initialization(make_para):
     """
     Test initialization with paragraphs, anchor, and requested size.
 
@@ -38,7 +75,7 @@ def test_formatted_text_initialization():
     REQ: A formatted text frame instance exposes its initialization parameters through like-named properties.
     REQ: After initialization, a formatted text frame instance is in the "new" state.
     """
-    text = [Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)]
+    text = [make_para(TEST_TEXT)]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text)
     assert element.text == text
@@ -47,7 +84,7 @@ def test_formatted_text_initialization():
     assert element.state == States.new
 
 
-def test_measure_with_text():
+def test_measure_with_text(make_para):
     """
     Test measure method properly calculates content size.
 
@@ -60,9 +97,7 @@ def test_measure_with_text():
     REQ: The minimum height occupied by a formatted text frame instance is the height of its requested size.
     REQ: The content height of a formatted text frame instance is the height required to fit all of its content at the requested size width.
     """
-    text = [
-        Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)
-    ]
+    text = [make_para(TEST_TEXT)]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text)
     measured_extent = element.measure(size)
@@ -85,16 +120,14 @@ def test_measure_without_text():
     assert element.content_size == Extent.zero
 
 
-def test_do_layout():
+def test_do_layout(make_para):
     """
     Test do_layout anchors the element correctly in target extent.
 
     REQ: The formatted text type implements a "do layout" method from the rendering frame protocol that yields a region of the same size
          as the target extent and an origin that positions the formatted text content in that region according to the frame's anchor point.
     """
-    text = [
-        Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)
-    ]
+    text = [make_para(TEST_TEXT)]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text)
     target_extent = Extent(Distance(20, "cm"), Distance(20, "cm"))
@@ -105,15 +138,13 @@ def test_do_layout():
     assert element.state == States.ready
 
 
-def test_do_layout_with_insufficient_space():
+def test_do_layout_with_insufficient_space(make_para):
     """
     Test do_layout trims content size if target extent is too small.
 
     REQ: The formatted text type "do layout" method clips the content size downward if the target extent is too small.
     """
-    text = [
-        Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)
-    ]
+    text = [make_para(TEST_TEXT)]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text)
     small_extent = Extent(Distance(5, "cm"), Distance(2, "cm"))
@@ -123,7 +154,7 @@ def test_do_layout_with_insufficient_space():
     assert region.extent.height <= small_extent.height
 
 
-def test_draw():
+def test_draw(make_para):
     """
     Test drawing with a mock DisplaySurface.
 
@@ -132,9 +163,7 @@ def test_draw():
     REQ: If a formatted text frame instance can fit all its content in the passed region then it indicates that it has no more to do by
          decorating the frame state with "all_data_consumed".
     """
-    text = [
-        Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)
-    ]
+    text = [make_para(TEST_TEXT)]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text)
     mock_canvas = MagicMock()
@@ -145,16 +174,14 @@ def test_draw():
     assert element.state & (States.drawn | States.all_data_consumed)
 
 
-def test_draw_do_not_consume():
+def test_draw_do_not_consume(make_para):
     """
     Test drawing with a mock DisplaySurface.
 
     REQ:  If a formatted text frame instance is flagged with "do not consume" then it always decorates its state with "have_more_data"
           after drawing.
     """
-    text = [
-        Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)
-    ]
+    text = [make_para(TEST_TEXT)]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text, do_not_consume=True)
     mock_canvas = MagicMock()
@@ -164,7 +191,7 @@ def test_draw_do_not_consume():
     element.draw(mock_canvas, region)
     assert element.state & (States.drawn | States.have_more_data)
 
-def test_draw_multipage():
+def test_draw_multipage(make_para, normal_style):
     """
     Test drawing with a mock DisplaySurface.
 
@@ -172,8 +199,8 @@ def test_draw_multipage():
          has more to do by decorating the frame state with "have_more_data"
     """
     text = [
-        Paragraph(in_typeface('Helvetica', "Test test"), style=normal_style),
-        Paragraph(in_typeface('Helvetica', "Test paragraph2"), style=normal_style)
+        make_para("Test test"),
+        make_para("Test paragraph2")
     ]
     size = Extent(
         Distance(10, "cm"),
@@ -194,29 +221,94 @@ def test_empty_text():
     element = FormattedText(size, AnchorPoint.CENTER, [])
     assert bool(element) is False  # Should evaluate as False for empty content
 
-def test_zero_extent_measurement():
+def test_zero_extent_measurement(make_para):
     """
     Test measuring with zero extent provided.
 
     REQ: The formatted text measure method yield the content size when the extent passed to it is empty.
     """
-    text = [Paragraph(in_typeface('Helvetica', "Test test\ntest"), style=normal_style)]
+    text = [make_para(TEST_TEXT)]
     element = FormattedText(Extent.zero, AnchorPoint.CENTER, text)
     measured_extent = element.measure(Extent.zero)
     assert measured_extent == element.content_size
 
 
-def test_spacing_before_and_after():
+def test_spacing_before_and_after(make_para):
     """
     Test getSpaceBefore and getSpaceAfter return proper values.
 
     REQ: formatted text & platypus integration details... need to specify?
     """
     text = [
-        Paragraph(in_typeface('Helvetica', "First paragraph"), style=normal_style),
-        Paragraph(in_typeface('Helvetica', "Second paragraph"), style=normal_style)
+        make_para("First paragraph"),
+        make_para("Second paragraph")
     ]
     size = Extent(Distance(10, "cm"), Distance(5, "cm"))
     element = FormattedText(size, AnchorPoint.CENTER, text)
     assert element.getSpaceBefore() == text[0].getSpaceBefore()
     assert element.getSpaceAfter() == text[-1].getSpaceBefore()
+
+
+def test_measure_after_draw_reprepares(make_para, normal_style):
+    """
+    Test that measuring after a draw consumed text measures only the remaining text.
+
+    REQ: The content size measured after a draw is the size of the text that draw left behind.
+    """
+    text = [make_para(_SHORT_TEXT), make_para(_LONG_TEXT)]
+    size = Extent(Distance(10, "cm"), Distance(normal_style.leading, "pt"))  # only room for the first paragraph
+    element = FormattedText(Extent(Distance(1, "pt"), Distance(_TALL_PT, "pt")), AnchorPoint.CENTER, list(text))
+    width_pt, _ = _measured_text(element, float(size.width.pt))
+    element.do_layout(size)
+    element.draw(MagicMock(), Region(Pos(Distance.zero, Distance.zero), size))
+    assert element.state & States.have_more_data
+    assert element.text == text[1:]
+
+    width_pt, height_pt = _measured_text(element, width_pt)
+    assert height_pt == pytest.approx(_wrapped_text_height(text[1:], width_pt))
+
+
+def test_measure_narrow_after_wide(make_para):
+    """
+    Test that measuring narrower after measuring wide wraps the text again.
+
+    REQ: The content height of a formatted text frame follows the most recently offered width.
+    """
+    text = [make_para(_SHORT_TEXT), make_para(_LONG_TEXT)]
+    element = FormattedText(Extent(Distance(1, "pt"), Distance(_TALL_PT, "pt")), AnchorPoint.CENTER, text)
+    heights = []
+    for offered in (2000.0, 120.0, 2000.0):
+        width_pt, height_pt = _measured_text(element, offered)
+        assert height_pt == pytest.approx(_wrapped_text_height(text, width_pt))
+        heights.append(height_pt)
+    assert heights[1] > heights[0] == heights[2]
+
+
+@pytest.mark.parametrize("edge", ["natural", "wrap"])
+@pytest.mark.parametrize("offset_pt", [-0.01, 0.01])
+def test_measure_near_paragraph_width(make_para, edge, offset_pt):
+    """
+    Test measuring a paragraph offered just less or just more than its natural or wrap width - narrower than the widest paragraph.
+
+    REQ: The content height of a formatted text frame is the height its text wraps to at the measured width.
+    """
+    text = [make_para(_SHORT_TEXT), make_para(_LONG_TEXT)]
+    element = FormattedText(Extent(Distance(1, "pt"), Distance(_TALL_PT, "pt")), AnchorPoint.CENTER, text)
+    width_pt, height_pt = _measured_text(element, _edge_width(text[0], edge) + offset_pt)
+    assert height_pt == pytest.approx(_wrapped_text_height(text, width_pt))
+
+
+@pytest.mark.parametrize("edge", ["natural", "wrap"])
+@pytest.mark.parametrize("offset_pt", [-0.01, 0.01])
+def test_measure_near_widest_paragraph_width(make_para, edge, offset_pt):
+    """
+    Test measuring text offered just less or just more than the natural or wrap width of its widest paragraph.
+
+    At or above the widest natural width, measure() takes the unwrapped height without asking ReportLab to wrap anything.
+
+    REQ: The content height of a formatted text frame is the height its text wraps to at the measured width.
+    """
+    text = [make_para(_SHORT_TEXT), make_para("Test test")]
+    element = FormattedText(Extent(Distance(1, "pt"), Distance(_TALL_PT, "pt")), AnchorPoint.CENTER, text)
+    width_pt, height_pt = _measured_text(element, _edge_width(text[0], edge) + offset_pt)
+    assert height_pt == pytest.approx(_wrapped_text_height(text, width_pt))
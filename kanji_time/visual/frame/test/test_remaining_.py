@@ -6,6 +6,8 @@
 Test suite for EmptySpace, globals, Page, and HorizontalRule classes with full branch coverage.
 """
 
+import copy
+
 import pytest
 from unittest.mock import MagicMock
 from reportlab.lib.colors import black, blue
@@ -17,6 +19,7 @@ from kanji_time.visual.layout.region import Extent, Region, Pos
 from kanji_time.visual.layout.distance import Distance, distance_list
 from kanji_time.visual.protocol.content import States
 from kanji_time.visual.frame.test.test_container import create_mock_layout_strategy, create_mock_child
+from kanji_time.visual.frame.test._fake_canvas import FakeCanvas
 
 
 # Empty Space Tests ------------------------------------------------------------------------------------------------------------------------ #
@@ -53,10 +56,11 @@ def test_empty_space_draw():
     """
     size = Extent(Distance(5, "cm"), Distance(5, "cm"))
     space = EmptySpace(size)
-    mock_canvas = MagicMock()
+    canvas = FakeCanvas()
     region = Region(Pos(Distance(0, "cm"), Distance(0, "cm")), size)
-    space.draw(mock_canvas, region)
+    space.draw(canvas, region)
     assert space.state == (States.drawn | States.reusable)
+    assert not canvas.calls
 
 
 # Page Tests ------------------------------------------------------------------------------------------------------------------------------- #
@@ -130,6 +134,22 @@ def test_page_factory():
     assert factory.settings.printable_region.extent in factory.settings.page_size
 
 
+def test_page_factory_copy_and_positional_call():
+    """
+    Test that a copied page factory builds the same pages from positional arguments.
+
+    REQ: A page factory can be copied, and it takes the page name, child elements, and layout strategy positionally as report
+         controllers pass them.
+    """
+    factory = copy.copy(Page.factory())
+    layout_strategy = create_mock_layout_strategy()
+    page_container = factory("Test page_container", {"child1": create_mock_child()}, layout_strategy)
+    assert page_container.element_name == "Test page_container"
+    assert page_container.layout_strategy == layout_strategy
+    assert len(page_container.child_elements) == 1
+    assert factory.settings.printable_region.extent == page_container.requested_size
+
+
 # Horizontal Rule Tests -------------------------------------------------------------------------------------------------------------------- #
 
 
@@ -167,10 +187,10 @@ def test_horizontal_rule_draw():
     """
     size = Extent(Distance(10, "cm"), Distance(0.5, "cm"))
     rule = HorizontalRule(size, black)
-    mock_canvas = MagicMock()
+    canvas = FakeCanvas()
     region = Region(Pos(Distance(0, "cm"), Distance(0, "cm")), size)
-    rule.draw(mock_canvas, region)
-    mock_canvas.setLineWidth.assert_called_once_with(size.height.pt)
-    mock_canvas.setStrokeColor.assert_called_once_with(black)
-    mock_canvas.line.assert_called_once()
+    rule.draw(canvas, region)
+    assert canvas.calls_to("setLineWidth") == [((size.height.pt,), {})]
+    assert canvas.calls_to("setStrokeColor") == [((black,), {})]
+    assert len(canvas.calls_to("line")) == 1
     assert rule.state == (States.drawn | States.reusable)
@@ -14,8 +14,9 @@ inside a larger one.
 """
 
 import enum
+from fractions import Fraction
 
-class AnchorPoint(enum.Flag):
+class AnchorPoint(enum.IntFlag, boundary=enum.STRICT):
     """
     Specify how a child content frame should be placed inside a parent container frame.
 
@@ -26,6 +27,11 @@ class AnchorPoint(enum.Flag):
 
     These values can be combined using bitwise OR:
         AnchorPoint.N | AnchorPoint.W → NW (top-left)
+
+    W wins over E and S wins over N when a combination names both sides of an axis.
+
+    Anchor points are plain ints underneath, so combining them is integer bit arithmetic.
+    The STRICT boundary keeps Flag's rejection of undefined bits, e.g. AnchorPoint(16) is a ValueError.
     """
     CENTER = 0
     N = 1
@@ -36,3 +42,28 @@ class AnchorPoint(enum.Flag):
     W = 8
     NW = 9
     SW = 12
+
+    def factors(self) -> tuple[Fraction, Fraction]:
+        """
+        Produce the fraction of the leftover width and height that falls left of and below an anchored extent.
+
+        Assuming PDF coordinates: (0, 0) is the SW corner, (1, 1) is the NE corner, and (1/2, 1/2) is the center.
+        """
+        return ANCHOR_FACTORS[self]
+
+
+def _axis_factor(anchor: AnchorPoint, low: AnchorPoint, high: AnchorPoint) -> Fraction:
+    """Place an anchor on one axis: the low side wins over the high side, and neither side means centered."""
+    if low in anchor:
+        return Fraction(0)
+    if high in anchor:
+        return Fraction(1)
+    return Fraction(1, 2)
+
+
+# Every combination of the four compass bits, precomputed so placement is a table lookup.
+# Public so Extent.anchor_at() can index it directly: that also takes a plain int mask and skips the factors() call.
+ANCHOR_FACTORS: dict[AnchorPoint, tuple[Fraction, Fraction]] = {
+    anchor: (_axis_factor(anchor, AnchorPoint.W, AnchorPoint.E), _axis_factor(anchor, AnchorPoint.S, AnchorPoint.N))
+    for anchor in map(AnchorPoint, range(16))
+}
@@ -62,14 +62,11 @@ from collections.abc import Callable
 from fractions import Fraction
 import math
 
-from copy import copy
-
 import enum
+import functools
 import re
 from typing import ClassVar
 
-from kanji_time.utilities.class_property import classproperty
-
 
 class DistanceUnit(enum.StrEnum):
     """Define measurement units for distance."""
@@ -93,6 +90,10 @@ unit_str = {
     str(u): u for u in DistanceUnit
 }
 
+# Distance units are always DistanceUnit members, so the symbolic units can be tested by identity.
+_REST = DistanceUnit.rest
+_INF = DistanceUnit.infinite
+
 
 # see SO:  https://stackoverflow.com/a/606307
 # 1 pica = 1/72 inch
@@ -114,6 +115,21 @@ twips_factor = {
 }
 
 
+# A measure followed by a 1 or 2 character unit suffix: group 1 is the measure and group 2 is the unit.
+_DIST_RE = re.compile(r"(\d+(?:[.]\d*)?)([^\d]{1,2})")
+
+
+# Exact conversion factors between every pair of units with a fixed size: (from unit, to unit) -> ratio.
+_RATIO: dict[tuple[DistanceUnit, DistanceUnit], Fraction] = {
+    (from_unit, to_unit): Fraction(from_twips, to_twips)
+    for from_unit, from_twips in twips_factor.items() if from_twips
+    for to_unit, to_twips in twips_factor.items() if to_twips
+}
+
+# The same ratios as floats for the unit properties (d.pt, d.inch, ...) which produce plain floats anyway.
+_FLOAT_RATIO = {units: float(ratio) for units, ratio in _RATIO.items()}
+
+
 _Distance = namedtuple('_Distance', "measure unit at_least")
 
 
@@ -134,53 +150,65 @@ class Distance(_Distance):
         - the minimum constraint case is going to be at_least, at_most, and between
         - there's no implementation of "percent" units.  Percent of what?  Tie this feature to the property delegation model.
         - convert this class to a Generic parameterized by MeasureType?
-        - can fit_to, zero, and infinite be expressed as Singletons?
 
     """
     # Factor: MeasureType needs to support ConvertibleToFloat if it doesn't already - do this later.
     MeasureType: ClassVar[type] = type(Fraction)
-    __match_args__ = ("measure", "unit", "at_least")
+    __slots__ = ()  # keep instances as lean as the underlying tuple
 
-    # fit_to, zero, and infinite should be Singletons so I can use "is" with them.
-    @classproperty
-    def fit_to(cls):
-        """Produce a known distance that models being fit into some unknown constraints."""
-        return Distance.parse("*")
-
-    @classproperty
-    def zero(cls) -> 'Distance':
-        """Produce a known distance of nothing."""
-        return Distance.parse("0pt")
-
-    @classproperty
-    def infinite(cls) -> 'Distance':
-        """Produce a known distance that larger than any other distance except itself."""
-        return Distance.parse("!")
+    __match_args__ = ("measure", "unit", "at_least")
+    # fit_to, zero, and infinite are singletons assigned once below the class body, so I can use "is" with them.
+    zero: ClassVar['Distance']  # a known distance of nothing
+    fit_to: ClassVar['Distance']  # a known distance that models being fit into some unknown constraints
+    infinite: ClassVar['Distance']  # a known distance that larger than any other distance except itself
 
-    def __new__(cls, measure: Fraction | float, unit: str | DistanceUnit, at_least: bool = False):
+    def __new__(cls, measure: Fraction | float, unit: str | DistanceUnit, at_least: bool = False) -> 'Distance':
         """Perform extra initialization beyond the default dataclass generated __init__ method's."""
         assert not isinstance(measure, Distance), "Distances can't nest"
-        measure = Fraction(measure)
-        unit = unit_str[unit] if isinstance(unit, str) else unit # Force units to be in the enumerated unit type
+        if type(measure) is not Fraction:  # pylint: disable=unidiomatic-typecheck
+            measure = Fraction(measure)
+        unit = unit_str[unit]  # Force units to be in the enumerated unit type - StrEnum members are their own keys here
+        return cls._interned(measure, unit, at_least)
+
+    # Distances are immutable, so identical (measure, unit, at_least) constructions can share one interned instance.
+    # Only the validated normal form is cached: bad arguments fail in __new__ with their own errors, not as unhashable cache keys.
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _interned(cls, measure: Fraction, unit: DistanceUnit, at_least: bool) -> 'Distance':
+        """Produce the one shared instance for a validated distance."""
         return super().__new__(cls, measure, unit, at_least)
 
-    def __bool__(self):
+    def __bool__(self) -> bool:
         """Yield true for non-zero distances."""
-        return not math.isclose(float(self.measure), 0.0)
+        # Compare the measure to zero directly: exact for a Fraction, still right for the float scalar division can leave
+        # behind, and no float round-trip through math.isclose.
+        return self.measure != 0
 
-    def __float__(self):
+    def __float__(self) -> float:
         """Conversion to silence ConvertibleToFloat issues."""
-        return float(self.measure)
+        return self.as_float()
 
-    def to(self, unit: DistanceUnit):
+    def as_float(self) -> float:
+        """Produce my measure as a plain float."""
+        measure = self.measure
+        if type(measure) is Fraction:  # pylint: disable=unidiomatic-typecheck
+            # One int true division - correctly rounded - without the trip through Fraction.__float__.
+            return measure.numerator / measure.denominator
+        return float(measure)  # scalar division can leave a float measure behind
+
+    def to(self, unit: DistanceUnit) -> 'Distance':
         """Convert distance to a particular measurement unit."""
         assert isinstance(unit, str)
-        if unit not in unit_str:
+        target = unit_str.get(unit)
+        if target is None:
             raise ValueError(f"Unrecognized target unit for conversion: '{unit}'")
-        if unit == self.unit:
-            return copy(self)
+        if target is self.unit:
+            return self
         assert isinstance(self.unit, DistanceUnit)
-        return Distance(twips_factor[self.unit]*self.measure/twips_factor[unit], unit, self.at_least)
+        ratio = _RATIO.get((self.unit, target))
+        if ratio is None:
+            raise TypeError(f"Cannot convert between the relative unit '{self.unit}' and '{target}'.")
+        return Distance(self.measure*ratio, target, self.at_least)
 
     def __str__(self) -> str:
         """
@@ -191,18 +219,21 @@ class Distance(_Distance):
             - Provide a settable # of significant digits - or even a preferred string format
 
         """
-        return f"{'>=' if self.at_least else ''}{round(float(self.measure), 1)}{unit_str[self.unit]}"
+        # Units are always DistanceUnit members, which format as their symbol: no table lookup needed.
+        return f"{'>=' if self.at_least else ''}{round(self.as_float(), 1)}{self.unit}"
 
     def __repr__(self) -> str:
         """Produce a reconstruction representation."""
-        return f"{self.__class__.__name__}({self.measure}, '{str(self.unit)}', at_least={self.at_least})"
+        return f"{self.__class__.__name__}({self.measure}, '{self.unit}', at_least={self.at_least})"
 
     def __copy__(self) -> 'Distance':
-        """A copy of this instance."""
-        return Distance(self.measure, self.unit, self.at_least)
+        """A copy of this instance: distances are immutable, so that is the instance itself."""
+        return self
 
+    # Layout code parses the same handful of literals over and over and the results are immutable: remember them.
     @classmethod
-    def parse(cls, d: str, at_least: bool = False):
+    @functools.lru_cache(maxsize=512)
+    def parse(cls, d: str, at_least: bool = False) -> 'Distance':
         r"""Parse a number in the form \d+([.]\d*)?)([^\d]{1,2}) + a unit suffix into a distance"""
         if not d:
             raise ValueError("Must pass a non-empty string.")
@@ -214,59 +245,51 @@ class Distance(_Distance):
             d = d[:-1]
             at_least = True
 
-        dist_re = re.compile(r"(\d+([.]\d*)?)([^\d]{1,2})")  # Review:  pull out the magic regexp to a property
-        m = dist_re.fullmatch(d)
+        m = _DIST_RE.fullmatch(d)
         if not m:
             raise ValueError(f"'{d}' is not a distance measurement.")
-        if m[3] not in unit_str:
-            raise ValueError(f"'{m[3]}' is not a distance unit.")
-        return Distance(Fraction(m[1]), m[3], at_least)
+        if m[2] not in unit_str:
+            raise ValueError(f"'{m[2]}' is not a distance unit.")
+        return Distance(Fraction(m[1]), m[2], at_least)
 
     # ISSUE: For arithmetic, consider converting to the finer grained unit (or even both to twips)
     #        do the operation, then convert to the result unit.
     #        --> would it be better to always express Distance.measure in the finest grained unit available? 1/10th of that?
 
     @classmethod
-    def __zero__(cls):  # for sum()
+    def __zero__(cls) -> 'Distance':  # for sum()
         """Additive identity."""
         return cls.zero
 
-    def fix_to(self, other):
+    def fix_to(self, other) -> 'Distance':
         """Fix a variable distance to a particular value if it satisfies the distance criterion."""
-        if other.unit == "*":  # or other.at_least
+        if other.unit is _REST:  # or other.at_least
             raise ValueError("May only fix a distance to a fixed distance.")
-        if self.unit != "*" and not self.at_least:
-            return copy(self)
+        if self.unit is not _REST and not self.at_least:
+            return self
         if self.at_least and other < self:
             raise ValueError("Fixing a distance to too small of a value.")
-        if self.unit != '*':
+        if self.unit is not _REST:
             return other.to(self.unit)
-        return copy(other)
+        return other
 
-    def __neg__(self):
+    def __neg__(self) -> 'Distance':
         """Produce a new distance that is the additive inverse of myself."""
-        if self.unit == "!":
+        if self.unit is _INF:
             return self.infinite
         return Distance(-self.measure, self.unit, self.at_least)
 
-    def __add__(self, other):
+    def __add__(self, other) -> 'Distance':
         """Sum two distances retaining the unit of this one."""
-        match other:
-            case Distance(measure, unit, at_least):
-                if unit == '!':
-                    return self.infinite
-                if unit == '*':
-                    return Distance(self.measure, self.unit, at_least=True)
-                if self.unit == '*':
-                    return Distance(measure, unit, at_least=True)
-                if unit != self.unit:
-                    other = other.to(self.unit)
-                return Distance(self.measure + other.measure, self.unit, self.at_least or at_least)
-            case int(z) if z == 0:
-                return copy(self)
+        # Plain isinstance tests: structural pattern matching costs too much on the hottest path in layout.
+        if isinstance(other, Distance):
+            # Dispatch on the kinds of unit on either side rather than comparing against each symbolic unit in turn.
+            return _ADD_TABLE[_UNIT_KIND[self.unit]][_UNIT_KIND[other.unit]](self, other)
+        if isinstance(other, int) and other == 0:
+            return self
         raise ValueError(f"Add not supported between Distance and {type(other)} of {other}.")
 
-    def __radd__(self, other):
+    def __radd__(self, other) -> 'Distance':
         """
         Sum two distances retaining the unit of the other one.
 
@@ -277,47 +300,47 @@ class Distance(_Distance):
             return other.__add__(self)  # pragma: no cover
         return self.__add__(other)
 
-    def __sub__(self, other):
+    def __sub__(self, other) -> 'Distance':
         """Subtract two distances retaining the unit of this one."""
         return self.__add__(-other)
 
-    def __rsub__(self, other):
+    def __rsub__(self, other) -> 'Distance':
         """Subtract two distances retaining the unit of that one."""
         return -self.__radd__(-other)
 
     # ----> DO NOT ADD __mul__ OR __div__ UNLESS IT'S ONLY BY A SCALAR:  these binops change units to areas or rates!
 
-    def __floordiv__(self, other):
+    def __floordiv__(self, other) -> 'Distance | int':
         """
         Divide a distance by a scalar.
 
         Dividing two unit-tagged numbers for the same dimension is possible!
         It yields a vanilla non-unit-tagged number ratio.
         """
-        match other:
-            case Distance(measure, unit, _):
-                if unit == DistanceUnit.infinite:
-                    return Distance.zero
-                if measure == Distance.zero.measure:  # pylint: disable=no-member
-                    raise ZeroDivisionError("Cannot divide a distance by a zero distance.")
-                if DistanceUnit.rest not in {unit, self.unit}:
-                    me = twips_factor[self.unit]*self.measure
-                    you = twips_factor[unit]*measure
-                    return me // you
-                raise ValueError(f"cannot floordiv {self} with {other}")
-            case 0 | 0.0:
-                raise ZeroDivisionError("Cannot divide a distance by zero.")
-            case int(n):
-                # OOOF!  This is a real bug!  Fix it!! too late now, and it doesn't affect me immediately.  
-                # floordiv & mod are a function of unit!  need to store the measure in twips and carry a truncate flag?  Ugly!
-                # honestly?  I probably should not be floordiving in the first place.
-                new_measure = Fraction(((twips_factor[self.unit]*self.measure / n)/twips_factor[self.unit]))
-                return self._replace(measure=new_measure)
+        if isinstance(other, Distance):
+            measure, unit = other.measure, other.unit
+            if unit is _INF:
+                return Distance.zero
+            if not measure:  # a zero measure in any unit
+                raise ZeroDivisionError("Cannot divide a distance by a zero distance.")
+            if unit is not _REST and self.unit is not _REST:
+                me = twips_factor[self.unit]*self.measure
+                you = twips_factor[unit]*measure
+                return me // you
+            raise ValueError(f"cannot floordiv {self} with {other}")
+        if other == 0:
+            raise ZeroDivisionError("Cannot divide a distance by zero.")
+        if isinstance(other, int):
+            # OOOF!  This is a real bug!  Fix it!! too late now, and it doesn't affect me immediately.  
+            # floordiv & mod are a function of unit!  need to store the measure in twips and carry a truncate flag?  Ugly!
+            # honestly?  I probably should not be floordiving in the first place.
+            new_measure = Fraction(((twips_factor[self.unit]*self.measure / other)/twips_factor[self.unit]))
+            return self._replace(measure=new_measure)
 
         raise ValueError(f"cannot floordiv {self} with {other}")
 
 
-    def __mod__(self, other):
+    def __mod__(self, other) -> 'Distance':
         """
         Modulo a distance by a scalar.
 
@@ -326,77 +349,95 @@ class Distance(_Distance):
 
         My result is the remaining distance after the division operation.
         """
-        match other:
-            case Distance(measure, unit, _):
-                if unit == DistanceUnit.infinite:
-                    return Distance.zero
-                if measure == Distance.zero.measure:  # pylint: disable=no-member
-                    raise ZeroDivisionError("Cannot divide a distance by a zero distance.")
-                if DistanceUnit.rest not in {unit, self.unit}:
-                    me = twips_factor[self.unit]*self.measure
-                    other = twips_factor[unit]*measure
-                    return self._replace(measure=(me % other)/twips_factor[self.unit])
-                raise ValueError(f"cannot modulo {self} with {other}")
-            case 0 | 0.0:
-                raise ZeroDivisionError("Cannot divide a distance by zero.")
-            case int(n):
-                return self._replace(measure=self.measure%n)
+        if isinstance(other, Distance):
+            measure, unit = other.measure, other.unit
+            if unit is _INF:
+                return Distance.zero
+            if not measure:  # a zero measure in any unit
+                raise ZeroDivisionError("Cannot divide a distance by a zero distance.")
+            if unit is not _REST and self.unit is not _REST:
+                me = twips_factor[self.unit]*self.measure
+                you = twips_factor[unit]*measure
+                return self._replace(measure=(me % you)/twips_factor[self.unit])
+            raise ValueError(f"cannot modulo {self} with {other}")
+        if other == 0:
+            raise ZeroDivisionError("Cannot divide a distance by zero.")
+        if isinstance(other, int):
+            return self._replace(measure=self.measure%other)
 
         raise ValueError(f"cannot modulo {self} with {other}")
 
-    def __truediv__(self, other):
+    def __truediv__(self, other) -> 'Distance | Fraction':
         """Divide a distance by a scalar."""
-        match other:
-            case Distance(measure, unit, _):
-                if unit == DistanceUnit.infinite:
-                    return Distance.zero
-                if measure == Distance.zero.measure:  # pylint: disable=no-member
-                    raise ZeroDivisionError("Cannot divide a distance by a zero distance.")
-                if DistanceUnit.rest not in (unit, self.unit):
-                    me = twips_factor[self.unit]*self.measure
-                    you = twips_factor[unit]*measure
-                    return me / you
-                raise ValueError(f"cannot truediv {self} with {other}")
-            case 0 | 0.0:
-                raise ZeroDivisionError("Cannot divide a distance by zero.")
-            case int(x) | float(x):
-                new_measure = (twips_factor[self.unit]*self.measure / x)/twips_factor[self.unit]
-                return self._replace(measure=new_measure)
+        if isinstance(other, Distance):
+            measure, unit = other.measure, other.unit
+            if unit is _INF:
+                return Distance.zero
+            if not measure:  # a zero measure in any unit
+                raise ZeroDivisionError("Cannot divide a distance by a zero distance.")
+            if unit is not _REST and self.unit is not _REST:
+                me = twips_factor[self.unit]*self.measure
+                you = twips_factor[unit]*measure
+                return me / you
+            raise ValueError(f"cannot truediv {self} with {other}")
+        if other == 0:
+            raise ZeroDivisionError("Cannot divide a distance by zero.")
+        if isinstance(other, (int, float)):
+            new_measure = (twips_factor[self.unit]*self.measure / other)/twips_factor[self.unit]
+            return self._replace(measure=new_measure)
 
         raise ValueError(f"cannot truediv {self} with {other}")
 
 
-    def __mul__(self, other):
+    def __mul__(self, other) -> 'Distance':
         """Multiply a distance by a scalar on the right."""
         if isinstance(other, Distance):
             raise ValueError("Cannot multiply a united number by a united number - we don't have areas yet.")
-        if self.unit == '!':
+        if self.unit is _INF:
             return self.infinite  # pragma: no cover
-        return Distance(self.measure * other, self.unit, self.at_least)
+        return self._scaled(self.measure * other)
 
-    def __rmul__(self, other):
+    def __rmul__(self, other) -> 'Distance':
         """Multiply a distance by a scalar on the left."""
         assert not isinstance(other, Distance), "should be in the the left multiplication for a Distance operand!"
-        if self.unit == '!':
+        if self.unit is _INF:
             return self.infinite  # pragma: no cover
-        return self._replace(measure=other*self.measure)
+        return self._scaled(other*self.measure)
+
+    def _scaled(self, measure) -> 'Distance':
+        """Produce a distance with my unit and constraint but a new <measure>."""
+        if type(measure) is Fraction:  # pylint: disable=unidiomatic-typecheck
+            # Already an exact Fraction in a validated unit: skip the coercing constructor.
+            return self._make((measure, self.unit, self.at_least))
+        # A float scalar - or a float measure left by scalar division - goes back through the constructor to become a Fraction.
+        return Distance(measure, self.unit, self.at_least)
+
+    def _converted_measure(self, other: 'Distance') -> Fraction:
+        """Produce the measure of <other> in my units without building an intermediate Distance."""
+        ratio = _RATIO.get((other.unit, self.unit))
+        if ratio is None:
+            return other.to(self.unit).measure  # let to() sort out the failure
+        return other.measure*ratio
 
     def __lt__(self, other) -> bool:
         """Compare for ordering."""
-        if self.unit == '!':
+        # "Is this distance negative?" against a literal 0 dominates layout code: test it before anything else.
+        if type(other) is int and other == 0:
+            return self.unit is not _INF and self.measure < 0
+        if self.unit is _INF:
             return False
-        match other:
-            # can I do this with Numeric semantics?  It was a PITA last time I tried it.
-            case int(n) if n == 0:
-                return self.measure < Fraction(n)
-            case float(f) if math.isclose(f, 0.0):
-                return float(self.measure) < f
-            case Distance(measure, unit, _):
-                if unit == '!':
-                    return True
-                if unit != '*' and self.unit != '*':
-                    measure = other.to(self.unit).measure
-                return self.measure < measure
+        # can I do this with Numeric semantics?  It was a PITA last time I tried it.
+        if isinstance(other, Distance):
+            measure, unit = other.measure, other.unit
+            if unit is _INF:
+                return True
+            if unit is not self.unit and unit is not _REST and self.unit is not _REST:
+                measure = self._converted_measure(other)
+            return self.measure < measure
+        if isinstance(other, int) and other == 0:
+            return self.measure < 0
+        if isinstance(other, float) and other == 0.0:
+            return self.measure < 0
         # Fall out to fail case
         raise ValueError(f"less than compares are undefined for types Distance and {type(other)}")
 
@@ -414,20 +455,26 @@ class Distance(_Distance):
               Consider for "at least 5" being equal to anything bigger than 5. This sounds like it should be a matches, not ==.
 
         """
-        match other:
-            # can I do this with Numeric semantics?  It was a PITA last time I tried it.
-            case int(n) if n == 0:
-                return self.measure == Fraction(0)
-            case float(f):
-                if self.unit == '!' and math.isinf(f):
-                    return f > 0.0
-                return math.isclose(f, 0.0) and math.isclose(float(self.measure), 0.0)
-            case Distance(measure, unit, _):
-                if unit == '!':
-                    return self.unit == '!'
-                if unit != '*' and self.unit != '*':
-                    measure = other.to(self.unit).measure
-                return self.measure == measure
+        # Interned construction and the shared zero/fit_to/infinite instances make identity a common, free answer.
+        if other is self:
+            return True
+        # "Is this distance zero?" against a literal 0 dominates layout code: test it before anything else.
+        if type(other) is int and other == 0:
+            return self.measure == 0
+        # can I do this with Numeric semantics?  It was a PITA last time I tried it.
+        if isinstance(other, Distance):
+            measure, unit = other.measure, other.unit
+            if unit is _INF:
+                return self.unit is _INF
+            if unit is not self.unit and unit is not _REST and self.unit is not _REST:
+                measure = self._converted_measure(other)
+            return self.measure == measure
+        if isinstance(other, int) and other == 0:
+            return self.measure == 0
+        if isinstance(other, float):
+            if self.unit is _INF and math.isinf(other):
+                return other > 0.0
+            return other == 0.0 and self.measure == 0
         # Fall out to fail case
         raise ValueError(f"equality compares are undefined for types Distance and {type(other)}")
 
@@ -439,14 +486,56 @@ class Distance(_Distance):
         """Compare for ordering."""
         return not self <= other
 
-    def logstr(self):
+    def logstr(self) -> str:
         """Produce a debugging string representation for the logs."""
         # pylint: disable=no-member
         return f"{self.inch:.2f}in"  # type: ignore
 
 
+# Unit kinds for dispatching arithmetic on symbolic units: a fixed or relative measure, a fit-to ('*') measure, or infinity ('!').
+_MEASURED, _FIT_TO, _INFINITE = range(3)
+_UNIT_KIND = {unit: _MEASURED for unit in DistanceUnit} | {_REST: _FIT_TO, _INF: _INFINITE}
+
+
+def _add_measured(me: Distance, other: Distance) -> Distance:
+    """Sum two measured distances in my units."""
+    if other.unit is me.unit:
+        # Same units - the common case: an exact Fraction sum in a validated unit can skip the coercing constructor.
+        # A float measure left by scalar division makes a float sum, which still needs the constructor.
+        measure = me.measure + other.measure
+        if type(measure) is Fraction:  # pylint: disable=unidiomatic-typecheck
+            return Distance._make((measure, me.unit, me.at_least or other.at_least))
+        return Distance(measure, me.unit, me.at_least or other.at_least)
+    other = other.to(me.unit)
+    return Distance(me.measure + other.measure, me.unit, me.at_least or other.at_least)
+
+
+def _add_fit_to(me: Distance, _: Distance) -> Distance:
+    """Adding a fit-to distance makes my measure a minimum."""
+    return Distance(me.measure, me.unit, at_least=True)
+
+
+def _add_to_fit_to(_: Distance, other: Distance) -> Distance:
+    """Adding to a fit-to distance makes the other measure a minimum."""
+    return Distance(other.measure, other.unit, at_least=True)
+
+
+def _add_infinite(_: Distance, __: Distance) -> Distance:
+    """Anything plus infinity is infinity."""
+    return Distance.infinite
+
+
+# Distance.__add__ handlers indexed by [my unit kind][other unit kind].
+_ADD_TABLE: tuple[tuple[Callable[[Distance, Distance], Distance], ...], ...] = (
+    (_add_measured, _add_fit_to, _add_infinite),    # me: measured
+    (_add_to_fit_to, _add_fit_to, _add_infinite),   # me: fit-to
+    (_add_measured, _add_fit_to, _add_infinite),    # me: infinite
+)
+
+
 def distance_list(*measures, unit: DistanceUnit) -> list[Distance]:
     """Convert a list of numbers to a list of distances expressed in <unit> units."""
+    unit = unit_str[unit]  # resolve the unit once for the whole batch rather than once per measure
     return [Distance(m, unit) for m in measures]
 
 
@@ -468,7 +557,17 @@ def make_lambda(du: DistanceUnit) -> Callable[[Distance], float]:
     See the Python rules around "nonlocal" vs "global" - it's a very subtle PITA.
     """
 
-    return lambda self: float(self.to(du).measure)
+    # Each property only ever converts into <du>: key its ratios by source unit alone to skip building a tuple key per read.
+    ratios = {from_unit: ratio for (from_unit, to_unit), ratio in _FLOAT_RATIO.items() if to_unit is du}
+
+    def convert(self: Distance) -> float:
+        """Convert with a single table lookup and a float multiply."""
+        ratio = ratios.get(self.unit)
+        if ratio is None:
+            return float(self.to(du).measure)  # let to() sort out the failure
+        return self.as_float()*ratio  # these properties yield floats anyway - skip the exact Fraction product
+
+    return convert
 
 for target_unit in DistanceUnit:
     if target_unit.name in ('pct', 'rest', 'infinite'):  # ignore percent for now.  Don't convert to infinite or 'fill-up' distances
@@ -477,3 +576,9 @@ for target_unit in DistanceUnit:
     conversion = property(converter, None, None, f"Convert this to a scalar value measured in '{target_unit.name}'.")
     setattr(Distance, target_unit.name, conversion)
     Distance.__annotations__[target_unit.name] = Distance.MeasureType
+
+
+# Plain class attributes rather than classproperties: layout reads these constantly, so make each read a single attribute load.
+Distance.zero = Distance(0, DistanceUnit.pt)
+Distance.fit_to = Distance(0, DistanceUnit.rest)
+Distance.infinite = Distance(0, DistanceUnit.infinite)
@@ -90,12 +90,10 @@ These classes have a small dependency footprint.  They model spatial abstraction
 from collections import namedtuple
 from collections.abc import Callable
 from fractions import Fraction
-from typing import Any, Self
-from copy import copy
+from typing import Any, ClassVar
 
-from kanji_time.utilities.class_property import classproperty
 from kanji_time.visual.layout.distance import Distance
-from kanji_time.visual.layout.anchor_point import AnchorPoint
+from kanji_time.visual.layout.anchor_point import AnchorPoint, ANCHOR_FACTORS
 
 # pylint: disable=wrong-import-position, wrong-import-order
 import logging
@@ -116,41 +114,40 @@ class Pos(PosTuple):
         - I could model a coordinate system's axis conventions by providing combiners for underlying binops.
 
     """
-    @classproperty
-    def zero(cls) -> Self:
-        """Produce a new known position at (0, 0)."""
-        return Pos(Distance.zero, Distance.zero)  # type: ignore
+    __slots__ = ()  # no per-instance __dict__: the namedtuple fields are all the state there is
+    zero: ClassVar['Pos']  # a known position at (0, 0)
 
-    def __str__(self):
+    def __str__(self) -> str:
         """Produce a human-readable representation."""
-        s = tuple(map(str, self))
-        return f"x={s[0]}, y={s[1]}"
+        return f"x={self.x}, y={self.y}"
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         """Produce a reconstruction representation."""
-        r = tuple(map(repr, self))
-        return f"{self.__class__.__name__}({r[0]}, {r[1]})"
+        return f"{self.__class__.__name__}({self.x!r}, {self.y!r})"
 
-    def __neg__(self):
+    def __neg__(self) -> 'Pos':
         """Produce new position reflected through (0, 0)."""
         return Pos(-self.x, -self.y)
 
-    def __add__(self, other):
+    def __add__(self, other) -> 'Pos':
         """Produce a new position that treats other as a delta adding its (possibly signed) x &  y to my own."""
-        match other:
-            case Pos(x, y):
-                return Pos(self.x + x, self.y + y)
+        # Plain isinstance tests: structural pattern matching costs too much on the hottest paths in layout.
+        if isinstance(other, Pos):
+            return Pos(self.x + other.x, self.y + other.y)
         raise ValueError(f"addition not defined for Pos and {type(other)}")
 
-    def logstr(self):
+    def logstr(self) -> str:
         """Produce a debugging string representation for the logs."""
         return f"position (x={self.x.logstr()}, y={self.y.logstr()})"
 
 
 class Extent(ExtentTuple):
     """Model a rectangular extent as an ordered pair of distances."""
+    __slots__ = ()
+    zero: ClassVar['Extent']  # a known empty extent
+    fit_to: ClassVar['Extent']  # a known extent that models being fit into some unknown constraints
 
-    def coalesce(self, other):
+    def coalesce(self, other) -> 'Extent':
         """Construct a new Extent instance with zero values in <self> filled in from <other>."""
         return Extent(self.width or other.width, self.height or other.height)
 
@@ -161,28 +158,12 @@ class Extent(ExtentTuple):
         Where do I position myself inside other with the anchor?
         Assuming PDF coordinate system.
         """
-        my_center = Pos(self.width // 2, self.height //2)
-        other_center = Pos(other.width // 2, other.height //2)
-
-        # Position my left side
-        if AnchorPoint.W in anchor_pt:
-            x = Distance.zero
-        elif AnchorPoint.E in anchor_pt:
-            x = other.width - self.width
-        else:
-            x = other_center.x - my_center.x
-
-        # Position my right side
-        if AnchorPoint.S in anchor_pt:
-            y = Distance.zero
-        elif AnchorPoint.N in anchor_pt:
-            y = other.height - self.height
-        else:
-            y = other_center.y - my_center.y
-
+        fx, fy = ANCHOR_FACTORS[anchor_pt]  # same as anchor_pt.factors() - see ANCHOR_FACTORS
+        x = Distance.zero if not fx else (other.width - self.width) if fx == 1 else (other.width - self.width) * fx
+        y = Distance.zero if not fy else (other.height - self.height) if fy == 1 else (other.height - self.height) * fy
         return Pos(x, y)
 
-    def conditional_replace(self, condition: Callable[[Any, Any], bool], **kwargs):
+    def conditional_replace(self, condition: Callable[[Any, Any], bool], **kwargs) -> 'Extent':
         """
         Create a new instance replacing fields with the passed keyword args whose old/new values satisfy the <condition> predicate.
 
@@ -195,58 +176,75 @@ class Extent(ExtentTuple):
             for key, value in kwargs.items()
             if condition(value, getattr(self, key))
         }
-        if filtered_kwargs:
-            return self._replace(**filtered_kwargs)
-        return self
-
-    def __str__(self):
+        if not filtered_kwargs:
+            return self
+        if filtered_kwargs.keys() <= {'width', 'height'}:
+            # Build the result directly: _replace goes through _make and a pass over the field names.
+            return Extent(filtered_kwargs.get('width', self.width), filtered_kwargs.get('height', self.height))
+        return self._replace(**filtered_kwargs)  # let _replace report any unknown fields
+
+    def replace_width_if(self, condition: Callable[[Any, Any], bool], width: Distance) -> 'Extent':
+        """Create a new instance with <width> when the new/old widths satisfy the <condition> predicate; otherwise yield myself."""
+        return Extent(width, self.height) if condition(width, self.width) else self
+
+    def replace_height_if(self, condition: Callable[[Any, Any], bool], height: Distance) -> 'Extent':
+        """Create a new instance with <height> when the new/old heights satisfy the <condition> predicate; otherwise yield myself."""
+        return Extent(self.width, height) if condition(height, self.height) else self
+
+    def __str__(self) -> str:
         """Produce a human readable representation."""
-        s = tuple(map(str, self))
-        return f"width={s[0]}, height={s[1]}"
+        return f"width={self.width}, height={self.height}"
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         """Produce a reconstruction representation."""
-        r = tuple(map(repr, self))
-        return f"{self.__class__.__name__}({r[0]}, {r[1]})"
+        return f"{self.__class__.__name__}({self.width!r}, {self.height!r})"
 
-    def __bool__(self):
+    def __bool__(self) -> bool:
         """Produce True when non-empty."""
         # An extent must have both width and height be non-empty.
-        return bool(self.width) and bool(self.height)
+        # The shared zero distance is the usual empty dimension: spot it by identity before asking the distances themselves.
+        width, height = self
+        if width is Distance.zero or height is Distance.zero:
+            return False
+        return bool(width) and bool(height)
 
     def __contains__(self, other: object) -> bool:
         """Produce True when <other> is weakly inside myself assuming a common origin."""
-        match other:
-            case Extent(w, h):
-                return w <= self.width and h <= self.height
-            case Pos(x, y):
-                return x <= self.width and y <= self.height
+        if isinstance(other, Extent):
+            return other.width <= self.width and other.height <= self.height
+        if isinstance(other, Pos):
+            return other.x <= self.width and other.y <= self.height
         raise ValueError(f"Cannot test {other} for containment in {self}")
 
-    def __add__(self, other):
+    def __add__(self, other) -> 'Extent':
         """Produce a new extent that adds <other>'s width and height to my own."""
-        match other:
-            case Extent(width, height):
-                return Extent(self.width + width, self.height + height)
+        if isinstance(other, Extent):
+            return Extent(self.width + other.width, self.height + other.height)
         raise ValueError(f"addition not defined for Extent and {type(other)}")
 
-    def __sub__(self, other):
+    def __sub__(self, other) -> 'Extent':
         """Produce a new extent that reduces my own width and height by <other>'s, with a min of zero."""
-        match other:
-            case Extent(width, height):
-                if self.width < width or self.height < height:
-                    logging.warning(
-                        "Subtracting a larger extent from a smaller:  %s - %s. Clamping offending dimensions to 0",
-                        self, other
-                    )
-                return Extent(max(self.width - width, Distance.zero), max(self.height - height, Distance.zero))
+        if isinstance(other, Extent):
+            # Subtract once and clamp on the sign of the differences rather than comparing the operands and then taking a max.
+            width = self.width - other.width
+            height = self.height - other.height
+            width_short, height_short = width < 0, height < 0
+            if (width_short or height_short) and logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Subtracting a larger extent from a smaller:  %s - %s. Clamping offending dimensions to 0",
+                    self, other
+                )
+            return Extent(Distance.zero if width_short else width, Distance.zero if height_short else height)
         raise ValueError(f"subtraction not defined for Extent and {type(other)}")
 
-    def __mul__(self, other: object):
+    def __mul__(self, other: object) -> 'Extent':
         """Produce a new extent that scales my width and height by a factor of <other>."""
+        if type(other) is int:  # pylint: disable=unidiomatic-typecheck
+            # Go straight to Distance.__mul__ rather than bouncing off int.__mul__ to reach Distance.__rmul__.
+            return Extent(self.width*other, self.height*other)
         return Extent(other*self.width, other*self.height)
 
-    def __rmul__(self, other: object):
+    def __rmul__(self, other: object) -> 'Extent':
         """Produce a new extent that scales my width and height by a factor of <other>."""
         return Extent(self.width*other,self.height*other)
 
@@ -256,14 +254,14 @@ class Extent(ExtentTuple):
     #     self.height *= other
     #     return self
 
-    def __floordiv__(self, other):
+    def __floordiv__(self, other) -> 'Extent':
         """Produce a new extent that reduces my width and height by a factor of <other>."""
         # I can floordiv by another extent to produce a pure number - same story on truediv
         if not isinstance(other, (Fraction, int)):
             raise ValueError("Cannot divide an extent by a non-scalar.")
         return Extent(self.width // other, self.height // other)
 
-    def __truediv__(self, other):
+    def __truediv__(self, other) -> 'Extent':
         """Produce a new extent that reduces my width and height by a factor of <other>."""
         if not isinstance(other, (float, Fraction, int)):
             raise ValueError("Cannot divide an extent by a non0-scalar.")
@@ -277,38 +275,26 @@ class Extent(ExtentTuple):
     #             return self
     #     raise ValueError(f"isub not available for type {type(other)}")
 
-    def __or__(self, other):
+    def __or__(self, other) -> 'Extent':
         """Produce a new extent that has the larger width and height (each) of my own and <other>'s ."""
         if other is None:
-            return copy(self)
-        match other:
-            case Extent(width, height):
-                return Extent(max(self.width, width), max(self.height, height))
+            return self
+        if isinstance(other, Extent):
+            return Extent(max(self.width, other.width), max(self.height, other.height))
         raise ValueError(f"Extent.union is not available for type {type(other)}")
 
-    def __and__(self, other):
+    def __and__(self, other) -> 'Extent':
         """Produce a new extent that has the smaller width and height (each) of my own and <other>'s ."""
         if other is None:
             return Extent.zero
-        match other:
-            case Extent(width, height):
-                return Extent(min(self.width, width), min(self.height, height))
+        if isinstance(other, Extent):
+            return Extent(min(self.width, other.width), min(self.height, other.height))
         raise ValueError(f"Extent.intersect is not available for type {type(other)}")
 
-    def logstr(self):
+    def logstr(self) -> str:
         """Produce a debugging string representation for the logs."""
         return f"extent {' by '.join(map(Distance.logstr, (self.width, self.height)))}"
 
-    @classproperty
-    def fit_to(cls) -> Self:
-        """Produce a new known extent that models being fit into some unknown constraints."""
-        return Extent(Distance.fit_to, Distance.fit_to)  # type: ignore
-
-    @classproperty
-    def zero(cls) -> Self:
-        """Produce a new known empty extent."""
-        return Extent(Distance.zero, Distance.zero)  # type: ignore
-
 
 class Region(RegionTuple):
     """
@@ -319,6 +305,7 @@ class Region(RegionTuple):
         - I could model a coordinate system's axis conventions by providing combiners for underlying binops.
 
     """
+    __slots__ = ()
 
     def __contains__(self, other: object) -> bool:
         """
@@ -332,17 +319,19 @@ class Region(RegionTuple):
             - there are axis direction issues all over this.  Derive from an coordinate system object?
 
         """
-        match other:
-            case Region(o, e):
-                # We contain the origin and the opposite corner
-                return o in self and Pos(o.x + e.width, o.y + e.height) in self
-            case Extent(w, h):
-                return Extent(w, h) in self.extent
-            case Pos(x, y):
-                return Pos(x - self.origin.x, y - self.origin.y) in self.extent
+        if isinstance(other, Region):
+            o, e = other
+            # We contain the origin and the opposite corner: offset the origin into my coordinates once and compare in place.
+            width, height = self.extent
+            dx, dy = o.x - self.origin.x, o.y - self.origin.y
+            return dx <= width and dy <= height and dx + e.width <= width and dy + e.height <= height
+        if isinstance(other, Extent):
+            return other in self.extent
+        if isinstance(other, Pos):
+            return Pos(other.x - self.origin.x, other.y - self.origin.y) in self.extent
         raise TypeError(f"containment not defined for Region and {type(other)}")
 
-    def bounds(self, unit):
+    def bounds(self, unit) -> tuple[tuple[Fraction, ...], tuple[Fraction, ...]]:
         """
         Produce unitless tuples for the origin & extent converted to <unit>.
 
@@ -357,19 +346,19 @@ class Region(RegionTuple):
               right is critical -- this is tuned to ReportLab conventions.
 
         """
-        convert = lambda d: d.to(unit).measure
-        return (tuple(map(convert, self.origin)), tuple(map(convert, self.extent)))
+        (x, y), (width, height) = self
+        return (x.to(unit).measure, y.to(unit).measure), (width.to(unit).measure, height.to(unit).measure)
 
-    def __str__(self):
+    def __str__(self) -> str:
         """Produce a human readable representation."""
-        s = tuple(map(str, self.bounds("in")))
-        return f"origin={s[0]}, extent={s[1]}"
+        origin, extent = self.bounds("in")
+        return f"origin={origin}, extent={extent}"
 
     def __repr__(self) -> str:
         """Produce a reconstruction representation."""
         return f"{self.__class__.__name__}({self.origin!r}, {self.extent!r})"
 
-    def __add__(self, other):
+    def __add__(self, other) -> 'Region':
         """
         Produce a new region offset from myself by <other>.
 
@@ -379,11 +368,16 @@ class Region(RegionTuple):
             regions.  I don't want to create a delta type out of a misguided sense of
             purity.
         """
-        match other:
-            case Pos(_, _):
-                return Region(self.origin + other, self.extent)
+        if isinstance(other, Pos):
+            return Region(self.origin + other, self.extent)
         raise ValueError(f"addition not defined for Pos and {type(other)}")
 
-    def logstr(self):
+    def logstr(self) -> str:
         """Produce a debugging string representation for the logs."""
         return f"region @ {self.origin.logstr()}, {self.extent.logstr()}"
+
+
+# Plain class attributes rather than classproperties: layout reads these constantly, so make each read a single attribute load.
+Pos.zero = Pos(Distance.zero, Distance.zero)
+Extent.zero = Extent(Distance.zero, Distance.zero)
+Extent.fit_to = Extent(Distance.fit_to, Distance.fit_to)
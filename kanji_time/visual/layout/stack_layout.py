@@ -282,11 +282,14 @@ class StackLayoutStrategy:
 
         """
 
-        fit_to: list[int] = fit_elements[self.stack_idx()]
+        fit_to: set[int] = set(fit_elements[self.stack_idx()])
+
+        # Gather the stacked dimension of every element once - the minimum stack size and the final allocation both work from it.
+        # Only the stacked half of the minimum size matters here, so skip a full measure() of both dimensions.
+        minimum_dims = [self.get_stack_dim(extent) for extent in element_extents]
+        total_stacked = sum(minimum_dims, start=Distance.zero)
 
         # Allocate slop space to the slop fit elements.
-        minimum_size = self.measure(element_extents, fit_elements)
-        total_stacked = self.get_stack_dim(minimum_size)
         slop_fit = Distance.zero
         # what if total_extent is too small? Totally ignored for now.
         if self.get_stack_dim(target_extent) > total_stacked and len(fit_to) > 0:
@@ -294,22 +297,21 @@ class StackLayoutStrategy:
             total_stacked = self.get_stack_dim(target_extent)
 
         stacked_dims = [
-            self.get_stack_dim(extent) + (slop_fit if i in fit_to else Distance.zero)
-            for i, extent in enumerate(element_extents)
+            stacked_dim + (slop_fit if i in fit_to else Distance.zero)
+            for i, stacked_dim in enumerate(minimum_dims)
         ]
 
         # origin in the lower left
         # Review: disregard (? could be weird for UX ?) elements with a zero stack dimension
         #       --> they don't render so don't contribute to the other dimension
-        origin = Pos(Distance.parse("0pt"), Distance.parse("0pt"))
-        child_regions = []
-        for stacked_pos, stacked_dim in zip(accumulate(stacked_dims, initial=self.get_stack_pos(origin)), stacked_dims):
-            layout_extent = self.make_extent(stacked_dim, self.get_other_dim(target_extent))
-            layout_pos = self.make_pos(stacked_pos, self.get_other_pos(origin))
-            child_regions.append(Region(layout_pos, layout_extent))
-            origin = layout_pos
-        max_other = max(map(self.get_other_dim, map(lambda x: x.extent, child_regions)))
-        return self.make_extent(total_stacked, max_other), child_regions
+        # Every child spans the whole target in the other dimension, so that is also the widest child.
+        other_dim = self.get_other_dim(target_extent)
+        other_pos = Distance.zero
+        child_regions = [
+            Region(self.make_pos(stacked_pos, other_pos), self.make_extent(stacked_dim, other_dim))
+            for stacked_pos, stacked_dim in zip(accumulate(stacked_dims, initial=Distance.zero), stacked_dims)
+        ]
+        return self.make_extent(total_stacked, other_dim), child_regions
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -0,0 +1,40 @@
+# conftest.py
+# Copyright (C) 2024, 2025 Andrew Milton
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+PyTest fixtures for layout testing.
+
+Distance and Extent are immutable, so the suite builds each shared value once instead of once per test.
+Page settings are a mutable dataclass, so every test gets its own copy.
+"""
+
+import pytest
+
+from kanji_time.visual.layout.distance import Distance
+from kanji_time.visual.layout.region import Extent
+
+
+@pytest.fixture
+def default_page_settings():
+    """A private copy of the global default page settings, as held by a new page factory."""
+    # Import here: only the page settings tests need the frame package and ReportLab behind it.
+    from kanji_time.visual.frame.page import Page  # pylint: disable=import-outside-toplevel
+    return Page.factory().settings
+
+
+@pytest.fixture(scope='module')
+def sample_extents():
+    """Four stacked element sizes with one "fit to" width and one "fit to" height."""
+    return [
+        Extent(Distance.parse("100pt"), Distance.parse("110pt")),
+        Extent(Distance.parse("*"), Distance.parse("220pt")),
+        Extent(Distance.parse("300pt"), Distance.parse("330pt")),
+        Extent(Distance.parse("400pt"), Distance.parse("*")),
+    ]
+
+
+@pytest.fixture(scope='module')
+def fit_to_test():
+    """The indices of the "fit to" widths and heights in sample_extents."""
+    return Extent([1], [3])
@@ -5,6 +5,7 @@
 """Provide branch coverage tests for the fundamental Distance type."""
 
 import math
+import operator
 from fractions import Fraction
 import pytest
 from kanji_time.visual.layout.distance import Distance, DistanceUnit, distance_list
@@ -12,6 +13,13 @@ from kanji_time.visual.layout.distance import Distance, DistanceUnit, distance_l
 # Disable this --> not x < y and x >= y are logically the same but include different code paths.
 # pylint: disable=unnecessary-negation
 
+
+@pytest.fixture(scope="module")
+def d10mm():
+    """Share the immutable 10mm distance used throughout the division tests."""
+    return Distance(10, DistanceUnit.mm)
+
+
 def test_distance_creation():
     """
     Test valid Distance object creation.
@@ -45,6 +53,18 @@ def test_distance_creation_invalid_unit():
         Distance(5, "invalid_unit")
 
 
+def test_distance_creation_invalid_measure():
+    """
+    Test that a measure that is not a number raises the constructor's own error.
+
+    REQ: Attempting to instantiate a distance with a distance or a non-numeric measure fails before any instance is shared.
+    """
+    with pytest.raises(AssertionError):
+        Distance(Distance(5, "cm"), "cm")  # type: ignore
+    with pytest.raises(TypeError, match="Rational"):
+        Distance([5], "cm")  # type: ignore
+
+
 def test_distance_zero():
     """
     Ensure zero Distance object is correct.
@@ -168,6 +188,17 @@ def test_distance_addition():
     assert d3.unit == DistanceUnit.cm
 
 
+def test_distance_addition_float_measure():
+    """
+    Ensure adding to a distance whose measure was left a float by scalar division yields an exact measure again.
+
+    REQ: Distance measures stay exact rational numbers through arithmetic.
+    """
+    d = Distance(5, DistanceUnit.cm) / 2.5 + Distance(1, DistanceUnit.cm)
+    assert type(d.measure) is Fraction  # pylint: disable=unidiomatic-typecheck
+    assert d.measure == 3
+
+
 def test_distance_add_infinite():
     """
     Ensure addition of two distances works correctly.
@@ -325,6 +356,18 @@ def test_distance_multiplication_right():
         f"Distance '{d2}'does propagate the 'at-least' flag when when left multiplied by '{d1}: result is '{d3}'"
 
 
+def test_distance_multiplication_float_measure():
+    """
+    Ensure scaling a distance whose measure was left a float by scalar division yields an exact measure again.
+
+    REQ: Distance measures stay exact rational numbers through arithmetic.
+    """
+    d = Distance(5, DistanceUnit.cm) / 2.5
+    for scaled in (d*2, 2*d):
+        assert type(scaled.measure) is Fraction  # pylint: disable=unidiomatic-typecheck
+        assert scaled.measure == 4
+
+
 def test_distance_invalid_multiplication():
     """
     Ensure multiplying two distances raises an error.
@@ -353,64 +396,41 @@ def test_distance_invalid_multiplication():
 #         f"Distance '{d2}' does propagate the 'at-least' flag when when left multiplied by '{d1}: result is '{d3}'"
 # 
 
-def test_distance_floor_division_infinite():
+def test_distance_floor_division_infinite(d10mm):
     """
     Ensure floor division of distance by a scalar works correctly.
 
     REQ: Any finite distance instance divided by an infinite distance produces a zero distance.
     """
-    d1 = Distance(10, DistanceUnit.mm)
+    d1 = d10mm
     d2 = Distance.infinite
     d3 = d1 // d2
     assert d3 == Distance.zero, f"Distance {d1} does not go to zero when divided by an infinite distance '{d2}'."
 
 
-def test_distance_floor_division_zero_distance():
-    """
-    Ensure floor division of distance by a scalar works correctly.
-
-    REQ: Any distance instance floor-divided the zero distance yields a zero division error exception.
+@pytest.mark.parametrize("op", [operator.floordiv, operator.mod, operator.truediv])
+@pytest.mark.parametrize("divisor", [Distance.zero, 0, 0.0], ids=["zero_distance", "integer_zero", "float_zero"])
+def test_distance_division_by_zero(d10mm, op, divisor):
     """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = Distance.zero
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 // d2
-
-
-def test_distance_floor_division_integer_zero():
-    """
-    Ensure floor division of distance by a scalar works correctly.
-
-    REQ: Any distance instance floor-divided by a numerical zero yields a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = 0
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 // d2
-
-
-def test_distance_floor_division_float_zero():
-    """
-    Ensure floor division of distance by a scalar works correctly.
+    Ensure dividing by zero raises an error.
 
-    REQ: Any distance instance floor-divided by a numerical zero yields a zero division error exception.
+    REQ: Any distance instance floor-divided by the zero distance or a numerical zero yields a zero division error exception.
+    REQ: Any finite distance modded on the right by a zero distance or a numerical zero produces a zero division error exception.
+    REQ: Any distance instance divided by a zero distance or a numerical zero yields a zero division error exception.
     """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = 0.0
     with pytest.raises(ZeroDivisionError):
-        _ = d1 // d2
+        _ = op(d10mm, divisor)
 
 
-def test_distance_floor_division_bogus():
+@pytest.mark.parametrize("op", [operator.floordiv, operator.mod, operator.truediv])
+def test_distance_division_bogus(d10mm, op):
     """
-    Ensure floor division of distance by a scalar works correctly.
+    Ensure dividing by a non-numeric value raises an error.
 
-    REQ: Any distance instance floor-divided by a non-numeric value yields a value error exception.
+    REQ: Any distance instance floor-divided, modded, or divided by a non-numeric value yields a value error exception.
     """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = "a"
     with pytest.raises(ValueError):
-        _ = d1 // d2
+        _ = op(d10mm, "a")
 
 
 def test_distance_floor_division_fuzzy():
@@ -425,26 +445,26 @@ def test_distance_floor_division_fuzzy():
         _ = d1 // d2
 
 
-def test_distance_floor_division():
+def test_distance_floor_division(d10mm):
     """
     Ensure floor division of distance by a scalar works correctly.
 
     REQ: Distance provides a binary floor-division operation that counts the (unitless) whole number of times that
          one distance fits into another.
     """
-    d1 = Distance(10, DistanceUnit.mm)
+    d1 = d10mm
     d2 = Distance(3, "mm")
     d3 = d1 // d2
     assert d3 == 3
 
 
-def test_distance_modulo():
+def test_distance_modulo(d10mm):
     """
     Ensure modulo operation on distances works correctly.
 
     REQ: Distance instances can be modded by a unitless number to produce the remainder distance after floor-division.
     """
-    d1 = Distance(10, DistanceUnit.mm)
+    d1 = d10mm
     d2 = 3
     d3 = d1 % d2  # type: ignore
     assert d3.measure == 1, f"Distance '{d1}' leaves an incorrect remainder when modded by '{d2} on the right: result is '{d3}'"
@@ -453,66 +473,18 @@ def test_distance_modulo():
         f"Distance '{d1}' does propagate the 'at-least' flag when when modded by '{d2} on the right: result is '{d3}'"
 
 
-def test_distance_modulo_infinite():
+def test_distance_modulo_infinite(d10mm):
     """
     Ensure floor division of distance by a scalar works correctly.
 
     REQ: Any finite distance modded on the right by an infinite distance produces a zero distance.
     """
-    d1 = Distance(10, DistanceUnit.mm)
+    d1 = d10mm
     d2 = Distance.infinite
     d3 = d1 % d2
     assert d3 == Distance.zero
 
 
-def test_distance_integer_zero_modulo():
-    """
-    Ensure dividing by zero raises an error.
-
-    REQ: Any finite distance modded on the right by a numerical zero produces a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = 0
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 % d2
-
-
-def test_distance_float_zero_modulo():
-    """
-    Ensure dividing by zero raises an error.
-
-    REQ: Any finite distance modded on the right by a numerical zero produces a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = 0.0
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 % d2  # type: ignore
-
-
-def test_distance_modulo_zero_distance():
-    """
-    Ensure floor modulo of distance by a scalar works correctly.
-
-    REQ: Any finite distance modded on the right by a zero distance produces a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = Distance.zero
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 % d2
-
-
-def test_distance_modulo_bogus():
-    """
-    Ensure floor modulo of distance by a scalar works correctly.
-
-    REQ: Any distance instance modded by a non-numeric value yields a value error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = "a"
-    with pytest.raises(ValueError):
-        _ = d1 % d2  # type: ignore
-
-
 def test_distance_modulo_fuzzy():
     """
     Ensure floor modulo of distance by a scalar works correctly.
@@ -537,88 +509,40 @@ def test_distance_modulo_crisp():
     assert d3.unit == "in"
     assert not d3.at_least
 
-def test_distance_division_scalar():
+def test_distance_division_scalar(d10mm):
     """
     Ensure distance can be divided by a scalar correctly.
 
     """
-    d = Distance(10, DistanceUnit.mm)
+    d = d10mm
     d2 = d / 2
     assert d2.measure == Fraction(5)
 
 
-def test_distance_division():
+def test_distance_division(d10mm):
     """
     Ensure distance can be divided by a scalar correctly.
 
     REQ: The distance type provides a binary division operator that yields the unitless quotient of the scalar measurements.
     """
-    d1 = Distance(10, DistanceUnit.mm)
+    d1 = d10mm
     d2 = Distance(5, DistanceUnit.mm)
     d3 = d1 / d2
     assert d3 == 2.0
 
 
-def test_distance_integer_zero_division():
-    """
-    Ensure dividing by zero raises an error.
-
-    REQ: Any distance instance divided by a numerical zero yields a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = 0
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 / d2
-
-
-def test_distance_float_zero_division():
-    """
-    Ensure dividing by zero raises an error.
-
-    REQ: Any distance instance divided by a numerical zero yields a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = 0.0
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 / d2
-
-
-def test_distance_division_zero_distance():
-    """
-    Ensure floor division of distance by a scalar works correctly.
-
-    REQ: Any distance instance divided by a zero distance yields a zero division error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = Distance.zero
-    with pytest.raises(ZeroDivisionError):
-        _ = d1 / d2
-
-
-def test_distance_division_infinite_distance():
+def test_distance_division_infinite_distance(d10mm):
     """
     Ensure floor division of distance by a scalar works correctly.
 
     REQ: Any distance instance divided by 'infinite' distance instance yields a zero distance.
     """
-    d1 = Distance(10, DistanceUnit.mm)
+    d1 = d10mm
     d2 = Distance.infinite
     d3 = d1 / d2
     assert d3 == Distance.zero
 
 
-def test_distance_division_bogus():
-    """
-    Ensure floor division of distance by a scalar works correctly.
-
-    REQ: Any distance instance divided by a non-numeric value yields a value error exception.
-    """
-    d1 = Distance(10, DistanceUnit.mm)
-    d2 = "a"
-    with pytest.raises(ValueError):
-        _ = d1 / d2
-
-
 def test_distance_division_fuzzy():
     """
     Ensure floor division of distance by a scalar works correctly.
@@ -885,3 +809,15 @@ def test_distance_logstr():
     d = Distance(1, "in")
     s = d.logstr()
     assert s == "1.00in"
+
+
+def test_distance_as_float():
+    """
+    Ensure that we can get a distance's measure as a plain float.
+
+    REQ: The distance type provides its measure as a float in its own units.
+    """
+    assert Distance(7, "in").as_float() == 7.0
+    assert Distance(Fraction(1, 3), "cm").as_float() == 1 / 3
+    assert Distance(1, "in").as_float() == float(Distance(1, "in"))
+    assert (Distance(3, "pt") / 2.0).as_float() == 1.5
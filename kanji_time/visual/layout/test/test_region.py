@@ -5,13 +5,26 @@
 """Test suite for Pos, Extent, and Region classes with full branch coverage."""
 
 import operator
+from operator import ge as _ge
 import pytest
-from fractions import Fraction
 from kanji_time.visual.layout.anchor_point import AnchorPoint
 from kanji_time.visual.layout.distance import Distance, DistanceUnit
 from kanji_time.visual.layout.region import Pos, Extent, Region
 
 
+CM = DistanceUnit.cm
+IN = DistanceUnit.inch
+
+# Distance instances are immutable and interned - share the common literals across the suite.
+_D0, _D5, _D10, _D15 = (Distance(v, CM) for v in (0, 5, 10, 15))
+_D20_IN = Distance(20, IN)
+
+
+def _extent(width, height, unit=CM) -> Extent:
+    """Build an extent from plain numbers in a single unit."""
+    return Extent(Distance(width, unit), Distance(height, unit))
+
+
 # Position Tests ------------------------------------------------------------- #
 
 
@@ -23,9 +36,8 @@ def test_pos_creation():
 
     REQ: The position type is instantiated with two distance instances, one for x and one for y.
     """
-    pos = Pos(Distance(5, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    assert pos.x == Distance(5, DistanceUnit.cm)
-    assert pos.y == Distance(10, DistanceUnit.cm)
+    pos = Pos(_D5, _D10)
+    assert pos == Pos(_D5, _D10)
 
 def test_pos_str():
     """
@@ -37,7 +49,7 @@ def test_pos_str():
     """
     pos = Pos(Distance(1.5, "in"), Distance(2, "in"))
     assert str(pos) == "x=1.5in, y=2.0in"
-    assert repr(pos) == "Pos(Distance(3/2, 'in', at_least=False), Distance(2, 'in', at_least=False))"
+    assert eval(repr(pos)) == pos  # pylint: disable=eval-used
     assert pos.logstr() == "position (x=1.50in, y=2.00in)"
 
 def test_pos_zero():
@@ -47,8 +59,7 @@ def test_pos_zero():
     REQ: The position type provides a unit-agnostic "zero" position with x == y == Distance.zero.
     """
     pos = Pos.zero
-    assert pos.x == Distance.zero
-    assert pos.y == Distance.zero
+    assert pos == Pos(Distance.zero, Distance.zero)
 
 def test_pos_addition():
     """
@@ -59,8 +70,7 @@ def test_pos_addition():
     pos1 = Pos(Distance(3, DistanceUnit.cm), Distance(4, DistanceUnit.cm))
     pos2 = Pos(Distance(2, DistanceUnit.cm), Distance(1, DistanceUnit.cm))
     result = pos1 + pos2
-    assert result.x == Distance(5, DistanceUnit.cm)
-    assert result.y == Distance(5, DistanceUnit.cm)
+    assert result == Pos(_D5, _D5)
 
 def test_pos_negation():
     """
@@ -68,23 +78,23 @@ def test_pos_negation():
 
     REQ: The position type provides a unary minus operator that yields the component-wise additive inverses of the operand.
     """
-    pos = Pos(Distance(5, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
+    pos = Pos(_D5, _D10)
     neg = -pos
-    assert neg.x == -Distance(5, DistanceUnit.cm)
-    assert neg.y == -Distance(10, DistanceUnit.cm)
+    assert neg == Pos(-_D5, -_D10)
 
-def test_pos_invalid_addition():
-    """
-    Test adding a Pos object with an invalid type raises ValueError.
 
-    REQ: Adding a non-position to a position instance yields a value error exception.
-    """
-    pos = Pos(Distance(1, DistanceUnit.cm), Distance(1, DistanceUnit.cm))
-    with pytest.raises(ValueError):
-        _ = pos + "invalid"
+# Extent Tests -------------------------------------------------------------- #
 
 
-# Extent Tests -------------------------------------------------------------- #
+# Three overlapping rectangles: a tall one, a wide one, and the least extent holding both.
+_EXTENT_W = _extent(5, 20, IN)
+_EXTENT_H = _extent(20, 10, IN)
+_EXTENT_SUPER = _extent(25, 20, IN)
+
+# Empty in one dimension or the other, and a fallback that is empty in neither.
+_EXTENT_W0 = Extent(Distance.zero, _D20_IN)
+_EXTENT_H0 = Extent(_D20_IN, Distance.zero)
+_EXTENT_NONEMPTY = Extent(Distance(10, "cm"), Distance(30, "in"))
 
 
 def test_extent_creation():
@@ -94,8 +104,7 @@ def test_extent_creation():
     REQ: The extent type is instantiated with two distance instances, one for width and one for height.
     """
     extent = Extent(Distance(10, DistanceUnit.inch), Distance(5, DistanceUnit.inch))
-    assert extent.width == Distance(10, DistanceUnit.inch)
-    assert extent.height == Distance(5, DistanceUnit.inch)
+    assert extent == Extent(Distance(10, DistanceUnit.inch), Distance(5, DistanceUnit.inch))
 
 def test_extent_zero():
     """
@@ -104,8 +113,7 @@ def test_extent_zero():
     REQ: The extent type provides a unit-agnostic "zero" extent with width == height == Distance.zero.
     """
     extent = Extent.zero
-    assert extent.width == Distance.zero
-    assert extent.height == Distance.zero
+    assert extent == Extent(Distance.zero, Distance.zero)
 
 def test_extent_fit_to():
     """
@@ -114,8 +122,7 @@ def test_extent_fit_to():
     REQ: The extent type provides a unit-agnostic "fit to" extent extent with width == height == Distance.fit_to.
     """
     extent = Extent.fit_to
-    assert extent.width == Distance.fit_to
-    assert extent.height == Distance.fit_to
+    assert extent == Extent(Distance.fit_to, Distance.fit_to)
 
 def test_extent_coalesce():
     """
@@ -124,15 +131,10 @@ def test_extent_coalesce():
     REQ: The extent type provides a binary coalesce operation that yields a new extent containing the components of the first operand except
          where those components evaluate to boolean false where they are replaced by the corresponding component in the second operand.
     """
-    extent_w0 = Extent(Distance.zero, Distance(20, "in"))
-    extent_h0 = Extent(Distance(20, "in"), Distance.zero)
-    extent_nonempty = Extent(Distance(10, "cm"), Distance(30, "in"))
-    result = extent_w0.coalesce(extent_nonempty)
-    assert result.width == Distance(10, "cm")
-    assert result.height == Distance(20, "in")
-    result = extent_h0.coalesce(extent_nonempty)
-    assert result.width == Distance(20, "in")
-    assert result.height == Distance(30, "in")
+    result = _EXTENT_W0.coalesce(_EXTENT_NONEMPTY)
+    assert result == Extent(Distance(10, "cm"), _D20_IN)
+    result = _EXTENT_H0.coalesce(_EXTENT_NONEMPTY)
+    assert result == Extent(_D20_IN, Distance(30, "in"))
 
 def test_extent_conditional_replace():
     """
@@ -141,14 +143,26 @@ def test_extent_conditional_replace():
     REQ: The extent type provides a conditional_replace method on an instance E that takes a binary predicate P and an extent N and yields a new
          extent C such that C(i) = N(i) if P[N(i), E(i)] else E(i).   TODO: eh, not quite how it's implemented but close enough.
     """
-    extent = Extent(Distance(20, "cm"), Distance(20, "in"))
-    predicate = operator.ge
-    result = extent.conditional_replace(predicate, width=Distance(12, "in"), height=Distance(15, "in"))
-    assert result.width == Distance(12, "in")
-    assert result.height == Distance(20, "in")
-    result = extent.conditional_replace(predicate)
+    extent = Extent(Distance(20, "cm"), _D20_IN)
+    result = extent.conditional_replace(_ge, width=Distance(12, "in"), height=Distance(15, "in"))
+    assert result == Extent(Distance(12, "in"), _D20_IN)
+    result = extent.conditional_replace(_ge)
     assert result == extent
 
+def test_extent_replace_if():
+    """
+    Test that we can create an updated extent conditionally on the current value of a single dimension.
+
+    REQ: The extent type provides replace_width_if and replace_height_if methods on an instance E that take a binary predicate P and a
+         distance N and yield a new extent with that dimension set to N if P[N, E(dim)] and E itself otherwise.
+    """
+    extent = Extent(Distance(20, "cm"), _D20_IN)
+    result = extent.replace_width_if(_ge, Distance(12, "in"))
+    assert result == Extent(Distance(12, "in"), _D20_IN)
+    assert extent.replace_height_if(_ge, Distance(15, "in")) is extent
+    result = extent.replace_height_if(_ge, Distance(25, "in"))
+    assert result == Extent(Distance(20, "cm"), Distance(25, "in"))
+
 def test_extent_str():
     """
     Test creating a zero position using the Pos.zero class property.
@@ -159,7 +173,7 @@ def test_extent_str():
     """
     extent = Extent(Distance(1.5, "in"), Distance(2, "in"))
     assert str(extent) == "width=1.5in, height=2.0in"
-    assert repr(extent) == "Extent(Distance(3/2, 'in', at_least=False), Distance(2, 'in', at_least=False))"
+    assert eval(repr(extent)) == extent  # pylint: disable=eval-used
     assert extent.logstr() == "extent 1.50in by 2.00in"
 
 def test_extent_bool():
@@ -169,130 +183,54 @@ def test_extent_bool():
     REQ: Any extent instance can be converted to a bool instances that is True iff both of its components can be converted to True
          as distances.
     """
-    extent_w0 = Extent(Distance.zero, Distance(20, "in"))
-    extent_h0 = Extent(Distance(20, "in"), Distance.zero)
-    extent_nonempty = Extent(Distance(10, "cm"), Distance(30, "in"))
-    assert not Extent.zero
-    assert not extent_w0
-    assert not extent_h0
-    assert extent_nonempty
+    assert tuple(map(bool, (Extent.zero, _EXTENT_W0, _EXTENT_H0, _EXTENT_NONEMPTY))) == (False, False, False, True)
 
-def test_extent_contains_extent():
+
+@pytest.mark.parametrize("item, host, expected", [
+    pytest.param(_EXTENT_W, _EXTENT_H, False, id="extent_w_in_h"),
+    pytest.param(_EXTENT_H, _EXTENT_W, False, id="extent_h_in_w"),
+    pytest.param(_EXTENT_W, _EXTENT_SUPER, True, id="extent_w_in_super"),
+    pytest.param(_EXTENT_H, _EXTENT_SUPER, True, id="extent_h_in_super"),
+    pytest.param(Pos(Distance(5, IN), _D20_IN), _EXTENT_W, True, id="pos_x_in_w"),
+    pytest.param(Pos(Distance(5, IN), _D20_IN), _EXTENT_H, False, id="pos_x_in_h"),
+    pytest.param(Pos(_D20_IN, Distance(10, IN)), _EXTENT_W, False, id="pos_y_in_w"),
+    pytest.param(Pos(_D20_IN, Distance(10, IN)), _EXTENT_H, True, id="pos_y_in_h"),
+    pytest.param(Pos(Distance(5, IN), _D20_IN), _EXTENT_SUPER, True, id="pos_x_in_super"),
+    pytest.param(Pos(_D20_IN, Distance(10, IN)), _EXTENT_SUPER, True, id="pos_y_in_super"),
+])
+def test_extent_contains(item, host, expected):
     """
-    Confirm that both dimensions must be less than a host extent's be be 'inside' the host.
+    Confirm that both dimensions of an extent or a position must be less than a host extent's be be 'inside' the host.
 
     REQ: The extent type provides a binary 'in' operator between extent instances that is true iff all components of the left operand
          are <= the corresponding components of the right operand as distances.
-    """
-    extent_w = Extent(Distance(5, "in"), Distance(20, "in"))
-    extent_h = Extent(Distance(20, "in"), Distance(10, "in"))
-    extent_super = Extent(Distance(25, "in"), Distance(20, "in"))
-    assert extent_w not in extent_h
-    assert extent_h not in extent_w
-    assert extent_w in extent_super
-    assert extent_h in extent_super
-
-def test_extent_contains_pos():
-    """
-    Confirm that both position dimensions must be less than a host extent's be be 'inside' the host.
-
     REQ: The extent type provides a binary 'in' operator between an extent instance and a position instance that is true iff all components
          of the left operand are <= the corresponding components of the right operand as distances.  TODO: review w/ negative extents
     """
-    pos_x = Pos(Distance(5, "in"), Distance(20, "in"))
-    pos_y = Pos(Distance(20, "in"), Distance(10, "in"))
-    extent_w = Extent(Distance(5, "in"), Distance(20, "in"))
-    extent_h = Extent(Distance(20, "in"), Distance(10, "in"))
-    extent_super = Extent(Distance(25, "in"), Distance(20, "in"))
-    assert pos_x in extent_w
-    assert pos_x not in extent_h
-    assert pos_y not in extent_w
-    assert pos_y in extent_h
-    assert pos_x in extent_super
-    assert pos_y in extent_super
-
-
-def test_extent_contains_bogus():
-    """
-    Confirm that both position dimensions must be less than a host extent's be be 'inside' the host.
-
-    REQ: The extent type provides a binary 'in' operator between extent instances that is true iff all components of the left operand
-         are <= the corresponding components of the right operand as distances.
-    """
-    extent_super = Extent(Distance(25, "in"), Distance(20, "in"))
-    with pytest.raises(ValueError):
-        _ = 'a' in extent_super
+    assert (item in host) == expected
 
 
-def test_extent_addition():
+@pytest.mark.parametrize("op, lhs, rhs, expected", [
+    pytest.param(operator.add, _extent(10, 5), _extent(5, 5), _extent(15, 10), id="add"),
+    pytest.param(operator.sub, _extent(10, 5), _extent(5, 2), _extent(5, 3), id="sub"),
+    pytest.param(operator.sub, _extent(5, 2), _extent(10, 5), Extent.zero, id="sub_clamped"),
+    pytest.param(operator.mul, _extent(10, 5), 2, _extent(20, 10), id="mul_right"),
+    pytest.param(operator.mul, 2, _extent(10, 5), _extent(20, 10), id="mul_left"),
+    pytest.param(operator.truediv, _extent(10, 5), 2, _extent(5, 2.5), id="truediv"),
+])
+def test_extent_arithmetic(op, lhs, rhs, expected):
     """
-    Test adding two Extent objects together.
+    Test adding and subtracting extents and scaling them by scalars.
 
     REQ: The extent type provides a binary addition operator that yields the component-wise sum of addends as distance instances.
-    REQ: All exceptions raised from distance arithmetic on extent components are passed along upwards without change.
-    """
-    extent1 = Extent(Distance(10, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    extent2 = Extent(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    result = extent1 + extent2
-    assert result.width == Distance(15, DistanceUnit.cm)
-    assert result.height == Distance(10, DistanceUnit.cm)
-    with pytest.raises(ValueError):
-        _ = extent1 + 'a'
-    with pytest.raises(TypeError):
-        # note that str intercepts + on the left before Extent can evaluate on the right
-        _ = 'a' + extent2
-
-
-def test_extent_subtraction():
-    """
-    Test subtracting one Extent from another.
-
     REQ: The extent type provides a binary subtraction operator that yields the component-wise difference of minuends as distance instances.
-    REQ: All exceptions raised from distance arithmetic on extent components are passed along upwards without change.
-    """
-    extent1 = Extent(Distance(10, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    extent2 = Extent(Distance(5, DistanceUnit.cm), Distance(2, DistanceUnit.cm))
-    result = extent1 - extent2
-    assert result.width == Distance(5, DistanceUnit.cm)
-    assert result.height == Distance(3, DistanceUnit.cm)
-    result = extent2 - extent1
-    assert result == Extent.zero
-    with pytest.raises(ValueError):
-        _ = extent1 - 'a'
-    with pytest.raises(TypeError):
-        _ = 'a' - extent2
-
-def test_extent_multiplication():
-    """
-    Test scaling an Extent object by a scalar multiplier.
-
     REQ: The extent type provides a scalar multiplication operator of an extent by a pure number that yields a new extent where the scalar
          product is distributed over the original extent's components.
-    REQ: All exceptions raised from distance arithmetic on extent components are passed along upwards without change.
-    """
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    result = extent * 2
-    assert result.width == Distance(20, DistanceUnit.cm)
-    assert result.height == Distance(10, DistanceUnit.cm)
-    result = 2 * extent
-    assert result.width == Distance(20, DistanceUnit.cm)
-    assert result.height == Distance(10, DistanceUnit.cm)
-
-def test_extent_division():
-    """
-    Test dividing an Extent object by a scalar divisor.
-
     REQ: The extent type provides a scalar division operator of an extent by a pure number that yields a new extent where the scalar division
          is distributed over the original extent's components.
-    REQ: All exceptions raised from distance arithmetic on extent components are passed along upwards without change.
     """
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    result = extent / 2
-    assert result.width == Distance(5, DistanceUnit.cm)
-    assert result.height == Distance(2.5, DistanceUnit.cm)
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    with pytest.raises(ValueError):
-        _ = extent / "invalid"
+    assert op(lhs, rhs) == expected
+
 
 # Allow this to fail.  Non-showstopper bug in Distance.floordiv -- frack-a-doodle-doo :-/
 #
@@ -304,9 +242,9 @@ def test_extent_division():
 #          floor division is distributed over the original extent's components.
 #     REQ: All exceptions raised from distance arithmetic on extent components are passed along upwards without change.
 #     """
-#     extent = Extent(Distance(10, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
+#     extent = Extent(_D10, _D5)
 #     result = extent // 2
-#     assert result.width == Distance(5, DistanceUnit.cm)
+#     assert result.width == _D5
 #     assert result.height == Distance(2, DistanceUnit.cm)
 #     with pytest.raises(ValueError):
 #         _ = extent // 'a'
@@ -314,53 +252,38 @@ def test_extent_division():
 #         _ = 'a' // extent
 
 
-def test_extent_union():
+@pytest.mark.parametrize("op, lhs, rhs, expected", [
+    pytest.param(operator.or_, _EXTENT_W, _EXTENT_H, _extent(20, 20, IN), id="union_w_h"),
+    pytest.param(operator.or_, _EXTENT_W, _EXTENT_SUPER, _extent(25, 20, IN), id="union_w_super"),
+    pytest.param(operator.or_, _EXTENT_H, _EXTENT_SUPER, _extent(25, 20, IN), id="union_h_super"),
+    pytest.param(operator.or_, _EXTENT_SUPER, None, _EXTENT_SUPER, id="union_none"),
+    pytest.param(operator.and_, _EXTENT_W, _EXTENT_H, _extent(5, 10, IN), id="intersect_w_h"),
+    pytest.param(operator.and_, _EXTENT_W, _EXTENT_SUPER, _extent(5, 20, IN), id="intersect_w_super"),
+    pytest.param(operator.and_, _EXTENT_H, _EXTENT_SUPER, _extent(20, 10, IN), id="intersect_h_super"),
+    pytest.param(operator.and_, _EXTENT_SUPER, None, Extent.zero, id="intersect_none"),
+])
+def test_extent_set_operations(op, lhs, rhs, expected):
     """
-    Test making the maximum of two extents.
+    Test making the maximum and minimum of two extents.
 
     REQ: The extent type provides a binary union operator that yields the least extent containing both operands.
+    REQ: The extent type provides a binary intersection operator that yields the greatest extent contained in both operands.
     """
-    extent_w = Extent(Distance(5, "in"), Distance(20, "in"))
-    extent_h = Extent(Distance(20, "in"), Distance(10, "in"))
-    extent_super = Extent(Distance(25, "in"), Distance(20, "in"))
-    result = extent_w | extent_h
-    assert result == Extent(Distance(20, "in"), Distance(20, "in"))
-    result = extent_w | extent_super
-    assert result == Extent(Distance(25, "in"), Distance(20, "in"))
-    result = extent_h | extent_super
-    assert result == Extent(Distance(25, "in"), Distance(20, "in"))
-    result = extent_super | None
-    assert result == extent_super
-    with pytest.raises(ValueError):
-        _ = extent_super | 'a'
-    with pytest.raises(TypeError):
-        _ = 'a' | extent_super
-
+    assert op(lhs, rhs) == expected
 
-def test_extent_intersection():
-    """
-    Test making the minimum of two extents.
 
-    REQ: The extent type provides a binary intersection operator that yields the greatest extent contained in both operands.
-    """
-    extent_w = Extent(Distance(5, "in"), Distance(20, "in"))
-    extent_h = Extent(Distance(20, "in"), Distance(10, "in"))
-    extent_super = Extent(Distance(25, "in"), Distance(20, "in"))
-    result = extent_w & extent_h
-    assert result == Extent(Distance(5, "in"), Distance(10, "in"))
-    result = extent_w & extent_super
-    assert result == Extent(Distance(5, "in"), Distance(20, "in"))
-    result = extent_h & extent_super
-    assert result == Extent(Distance(20, "in"), Distance(10, "in"))
-    result = extent_super & None
-    assert result == Extent.zero
-    with pytest.raises(ValueError):
-        _ = extent_super & 'a'
-    with pytest.raises(TypeError):
-        _ = 'a' & extent_super
+_OUTER = _extent(100, 100)
+_INNER = _extent(50, 50)
 
 
-def test_extent_anchor():
+@pytest.mark.parametrize("anchor, x, y", [
+    (AnchorPoint.CENTER, 25, 25),
+    (AnchorPoint.N, 25, 50),
+    (AnchorPoint.S, 25, 0),
+    (AnchorPoint.W, 0, 25),
+    (AnchorPoint.E, 50, 25),
+])
+def test_extent_anchor(anchor, x, y):
     """
     Test anchoring one Extent inside another using anchor point rules.
 
@@ -372,23 +295,7 @@ def test_extent_anchor():
          centers of that edge on E1 and E2 coincide.
     REQ: The result of anchoring E1 to E2 has negative components where an edge on E1 is longer then the corresponding edge on E2.
     """
-    outer = Extent(Distance(100, DistanceUnit.cm), Distance(100, DistanceUnit.cm))
-    inner = Extent(Distance(50, DistanceUnit.cm), Distance(50, DistanceUnit.cm))
-    anchored_pos = inner.anchor_at(AnchorPoint.CENTER, outer)
-    assert anchored_pos.x == Distance(25, DistanceUnit.cm)
-    assert anchored_pos.y == Distance(25, DistanceUnit.cm)
-    anchored_pos = inner.anchor_at(AnchorPoint.N, outer)
-    assert anchored_pos.x == Distance(25, DistanceUnit.cm)
-    assert anchored_pos.y == Distance(50, DistanceUnit.cm)
-    anchored_pos = inner.anchor_at(AnchorPoint.S, outer)
-    assert anchored_pos.x == Distance(25, DistanceUnit.cm)
-    assert anchored_pos.y == Distance(0, DistanceUnit.cm)
-    anchored_pos = inner.anchor_at(AnchorPoint.W, outer)
-    assert anchored_pos.x == Distance(0, DistanceUnit.cm)
-    assert anchored_pos.y == Distance(25, DistanceUnit.cm)
-    anchored_pos = inner.anchor_at(AnchorPoint.E, outer)
-    assert anchored_pos.x == Distance(50, DistanceUnit.cm)
-    assert anchored_pos.y == Distance(25, DistanceUnit.cm)
+    assert _INNER.anchor_at(anchor, _OUTER) == Pos(Distance(x, CM), Distance(y, CM))
 
 
 # Region Tests --------------------------------------------------------------- #
@@ -400,8 +307,8 @@ def test_region_creation():
 
     REQ: The region type is instantiated with position instance for the origin and an extent instance.
     """
-    origin = Pos(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
+    origin = Pos(_D5, _D5)
+    extent = Extent(_D10, _D10)
     region = Region(origin, extent)
     assert region.origin == origin
     assert region.extent == extent
@@ -421,83 +328,35 @@ def test_region_str():
         Extent(Distance(1.5, "in"), Distance(2, "in"))
     )
     assert str(region) == "origin=(Fraction(1, 1), Fraction(7, 2)), extent=(Fraction(3, 2), Fraction(2, 1))"
-    assert repr(region) == "Region(Pos(Distance(1, 'in', at_least=False), Distance(7/2, 'in', at_least=False)), Extent(Distance(3/2, 'in', at_least=False), Distance(2, 'in', at_least=False)))"
+    assert eval(repr(region)) == region  # pylint: disable=eval-used
     assert region.logstr() == "region @ position (x=1.00in, y=3.50in), extent 1.50in by 2.00in"
 
-def test_region_contains_point():
-    """
-    Test checking if a point is contained within a Region.
+# Share a 10cm square region at the origin across the containment and bogus operand tests.
+_UNIT_REGION = Region(Pos(_D0, _D0), Extent(_D10, _D10))
 
-    REQ: The region type provides a binary 'in' operator between a region instance R and a position instance P that is true
-         iff (P - R.origin) is contained in R.extent.
-    """
-    origin = Pos(Distance(0, DistanceUnit.cm), Distance(0, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    region = Region(origin, extent)
-    point_inside = Pos(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    point_outside = Pos(Distance(15, DistanceUnit.cm), Distance(15, DistanceUnit.cm))
-    assert point_inside in region
-    assert point_outside not in region
 
-def test_region_contains_region():
+@pytest.mark.parametrize("item, expected", [
+    pytest.param(Pos(_D5, _D5), True, id="point_inside"),
+    pytest.param(Pos(_D15, _D15), False, id="point_outside"),
+    pytest.param(Region(Pos(_D5, _D5), _extent(3, 4)), True, id="region_inside"),
+    pytest.param(Region(Pos(_D15, _D15), Extent.zero), False, id="region_outside_origin"),
+    pytest.param(Region(Pos(_D5, _D5), Extent(_D10, _D10)), False, id="region_outside_corner"),
+    pytest.param(_extent(3, 4), True, id="extent_inside"),
+    pytest.param(Extent(_D15, _D5), False, id="extent_too_wide"),
+    pytest.param(Extent(_D5, _D15), False, id="extent_too_tall"),
+])
+def test_region_contains(item, expected):
     """
-    Test checking if a point is contained within a Region.
+    Test checking if a point, region, or extent is contained within a Region.
 
+    REQ: The region type provides a binary 'in' operator between a region instance R and a position instance P that is true
+         iff (P - R.origin) is contained in R.extent.
     REQ: The region type provides a binary 'in' operator between a region instance R1 and a region instance R2 that is true
          iff R1.origin is contained in R2 and (R1.extent - Extent(R1 - R2)) is in R2.extent.
-    """
-    origin = Pos(Distance(0, DistanceUnit.cm), Distance(0, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    region = Region(origin, extent)
-    region_inside = Region(
-        Pos(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm)),
-        Extent(Distance(3, DistanceUnit.cm), Distance(4, DistanceUnit.cm))
-    )
-    region_outside_1 = Region(
-        Pos(Distance(15, DistanceUnit.cm), Distance(15, DistanceUnit.cm)),
-        Extent.zero
-    )
-    region_outside_2 = Region(
-        Pos(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm)),
-        Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    )
-    assert region_inside in region
-    assert region_outside_1 not in region
-    assert region_outside_2 not in region
-
-def test_region_contains_extent():
-    """
-    Test checking if a point is contained within a Region.
-
     REQ: The region type provides a binary 'in' operator between a region instance R and an extent instance E that is true
          iff E is contained in R.extent
     """
-    origin = Pos(Distance(0, DistanceUnit.cm), Distance(0, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    region = Region(origin, extent)
-    extent_inside = Extent(Distance(3, DistanceUnit.cm), Distance(4, DistanceUnit.cm))
-    extent_outside_1 = Extent(Distance(15, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    extent_outside_2 = Extent(Distance(5, DistanceUnit.cm), Distance(15, DistanceUnit.cm))
-    assert extent_inside in region
-    assert extent_outside_1 not in region
-    assert extent_outside_2 not in region
-
-def test_region_contains_bogus():
-    """
-    Test checking if a point is contained within a Region.
-
-    REQ: The region type's 'in' operator yields a type error exception if it is applied to instances of types other than
-         position, extent, or region.
-    """
-    origin = Pos(Distance(0, DistanceUnit.cm), Distance(0, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    region = Region(origin, extent)
-    with pytest.raises(TypeError):
-        'a' in region
-    with pytest.raises(TypeError):
-        3 in region
-    with pytest.raises(TypeError):
-        (10, 2.0) in region
+    assert (item in _UNIT_REGION) == expected
 
 def test_region_bounds():
     """
@@ -506,12 +365,12 @@ def test_region_bounds():
     REQ: The region type provides a 'bounds' method that converts all distance measures to a passed distance unit and yields this result as
          ordered pairs for the lower-left and upper-right corners with the unit stripped off (ie, plain numbers).
     """
-    origin = Pos(Distance(1, DistanceUnit.inch), Distance(1, DistanceUnit.inch))
-    extent = Extent(Distance(2, DistanceUnit.inch), Distance(2, DistanceUnit.inch))
-    region = Region(origin, extent)
-    bounds: tuple[tuple[Fraction, Fraction], tuple[Fraction, Fraction]] = region.bounds(DistanceUnit.cm)
-    bounds_str = f"(({float(bounds[0][0]):.2f}, {float(bounds[0][1]):.2f}), ({float(bounds[1][0]):.2f}, {float(bounds[1][1]):.2f}))"
-    assert bounds_str == "((2.54, 2.54), (5.08, 5.08))"
+    from fractions import Fraction  # pylint: disable=import-outside-toplevel
+    region = Region(Pos(Distance(1, IN), Distance(1, IN)), _extent(2, 2, IN))
+    origin, extent = region.bounds(CM)
+    # Conversions are exact in twips: 1440 to the inch and 567 to the centimeter, so 1in is 160/63cm (about 2.54cm).
+    assert origin == (Fraction(160, 63), Fraction(160, 63))
+    assert extent == (Fraction(320, 63), Fraction(320, 63))
 
 def test_region_addition():
     """
@@ -521,22 +380,50 @@ def test_region_addition():
          and whose origin is R's origin offset by P.
     REQ: All exceptions raised from distance arithmetic in a region are passed upwards without change.
     """
-    origin = Pos(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
+    origin = Pos(_D5, _D5)
+    extent = Extent(_D10, _D10)
     region = Region(origin, extent)
     shift = Pos(Distance(2, DistanceUnit.cm), Distance(3, DistanceUnit.cm))
     moved_region = region + shift
-    assert moved_region.origin.x == Distance(7, DistanceUnit.cm)
-    assert moved_region.origin.y == Distance(8, DistanceUnit.cm)
+    assert moved_region == Region(Pos(Distance(7, DistanceUnit.cm), Distance(8, DistanceUnit.cm)), extent)
+
+
+# Bogus Operand Tests -------------------------------------------------------- #
+
 
-def test_region_invalid_addition():
+@pytest.mark.parametrize("op, lhs, rhs, error", [
+    pytest.param(operator.add, Pos(_D5, _D5), "invalid", ValueError, id="pos_add"),
+    pytest.param(operator.contains, _EXTENT_SUPER, "a", ValueError, id="extent_contains"),
+    pytest.param(operator.add, _extent(10, 5), "a", ValueError, id="extent_add"),
+    pytest.param(operator.sub, _extent(10, 5), "a", ValueError, id="extent_sub"),
+    pytest.param(operator.truediv, _extent(10, 5), "invalid", ValueError, id="extent_truediv"),
+    pytest.param(operator.or_, _EXTENT_SUPER, "a", ValueError, id="extent_union"),
+    pytest.param(operator.and_, _EXTENT_SUPER, "a", ValueError, id="extent_intersect"),
+    pytest.param(operator.contains, _UNIT_REGION, "a", TypeError, id="region_contains_str"),
+    pytest.param(operator.contains, _UNIT_REGION, 3, TypeError, id="region_contains_int"),
+    pytest.param(operator.contains, _UNIT_REGION, (10, 2.0), TypeError, id="region_contains_tuple"),
+    pytest.param(operator.add, _UNIT_REGION, "invalid", ValueError, id="region_add"),
+])
+def test_bogus_operands(op, lhs, rhs, error):
     """
-    Test adding an invalid type to a Region raises ValueError.
+    Confirm that position, extent, and region operators reject operands of the wrong type.
 
+    REQ: Adding a non-position to a position instance yields a value error exception.
+    REQ: All exceptions raised from distance arithmetic on extent components are passed along upwards without change.
+    REQ: The region type's 'in' operator yields a type error exception if it is applied to instances of types other than
+         position, extent, or region.
     REQ: Adding an instance of any other type than position to a region instance yields a value error exception.
     """
-    origin = Pos(Distance(5, DistanceUnit.cm), Distance(5, DistanceUnit.cm))
-    extent = Extent(Distance(10, DistanceUnit.cm), Distance(10, DistanceUnit.cm))
-    region = Region(origin, extent)
-    with pytest.raises(ValueError):
-        _ = region + "invalid"
+    with pytest.raises(error):
+        _ = op(lhs, rhs)
+
+
+@pytest.mark.parametrize("op", [operator.add, operator.sub, operator.or_, operator.and_])
+def test_str_left_operand(op):
+    """
+    Confirm that a string on the left of an extent operator yields a type error exception.
+
+    Extent defines no reflected forms of these operators, so Python raises TypeError once str declines the operation.
+    """
+    with pytest.raises(TypeError):
+        _ = op("a", _EXTENT_SUPER)
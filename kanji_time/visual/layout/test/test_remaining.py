@@ -4,16 +4,22 @@
 
 """Test suite for AnchorPoint, PageSettings, and PaperNames modules with full branch coverage."""
 
+from fractions import Fraction
+
 import pytest
 from reportlab.lib.pagesizes import A4, LETTER
 from kanji_time.visual.layout.anchor_point import AnchorPoint
 from kanji_time.visual.layout.paper_names import PaperNames, PaperOrientations
-from kanji_time.visual.frame.page import Page
 
 
 # Anchor Point Tests ----------------------------------------------------------------------------------------------------------------------- #
 
 
+# Short aliases for the compass labels keep the anchor point tables and assertions readable.
+_N, _E, _S, _W = AnchorPoint.N, AnchorPoint.E, AnchorPoint.S, AnchorPoint.W
+_NE, _NW, _SE, _SW = AnchorPoint.NE, AnchorPoint.NW, AnchorPoint.SE, AnchorPoint.SW
+
+
 def test_anchor_point_values():
     """
     Test all defined AnchorPoint values.
@@ -22,14 +28,14 @@ def test_anchor_point_values():
          and CENTER as labels.
     """
     assert AnchorPoint.CENTER in AnchorPoint
-    assert AnchorPoint.N in AnchorPoint
-    assert AnchorPoint.E in AnchorPoint
-    assert AnchorPoint.S in AnchorPoint
-    assert AnchorPoint.W in AnchorPoint
-    assert AnchorPoint.SE in AnchorPoint
-    assert AnchorPoint.NE in AnchorPoint
-    assert AnchorPoint.NW in AnchorPoint
-    assert AnchorPoint.SW in AnchorPoint
+    assert _N in AnchorPoint
+    assert _E in AnchorPoint
+    assert _S in AnchorPoint
+    assert _W in AnchorPoint
+    assert _SE in AnchorPoint
+    assert _NE in AnchorPoint
+    assert _NW in AnchorPoint
+    assert _SW in AnchorPoint
 
 
 def test_anchor_point_center_zero():
@@ -39,65 +45,68 @@ def test_anchor_point_center_zero():
     REQ: The CENTER label is the unique label with a bit representation of 0.
     """
     assert AnchorPoint.CENTER.value == 0
-    assert AnchorPoint.N.value != 0
-    assert AnchorPoint.E.value != 0
-    assert AnchorPoint.S.value != 0
-    assert AnchorPoint.W.value != 0
-    assert AnchorPoint.SE.value != 0
-    assert AnchorPoint.NE.value != 0
-    assert AnchorPoint.NW.value != 0
-    assert AnchorPoint.SW.value != 0
-
-
-def test_anchor_point_cardinal_unique_bits():
+    assert _N.value != 0
+    assert _E.value != 0
+    assert _S.value != 0
+    assert _W.value != 0
+    assert _SE.value != 0
+    assert _NE.value != 0
+    assert _NW.value != 0
+    assert _SW.value != 0
+
+
+@pytest.mark.parametrize("direction, others", [
+    pytest.param(_N, (_E, _S, _W), id="N"),
+    pytest.param(_E, (_N, _S, _W), id="E"),
+    pytest.param(_S, (_N, _E, _W), id="S"),
+    pytest.param(_W, (_N, _E, _S), id="W"),
+])
+def test_anchor_point_cardinal_unique_bits(direction, others):
     """
     Test all defined AnchorPoint values.
 
     REQ: The N, S, E, W cardinal direction labels each have distinct bits set from the others.
     """
-    not_N = AnchorPoint.E | AnchorPoint.S | AnchorPoint.W
-    assert not_N.value != 0
-    assert (AnchorPoint.N & not_N).value == 0, f"AnchorPoint.N & not_N == {AnchorPoint.N & not_N} == {(AnchorPoint.N & not_N).value}"
-
-    not_E = AnchorPoint.N | AnchorPoint.S | AnchorPoint.W
-    assert not_E.value != 0
-    assert (AnchorPoint.E & not_E).value == 0, f"AnchorPoint.E & not_E == {AnchorPoint.E & not_E} == {(AnchorPoint.E & not_E).value}"
+    not_direction = others[0] | others[1] | others[2]
+    assert not_direction.value != 0
+    assert (direction & not_direction).value == 0, f"{direction} & {not_direction} == {(direction & not_direction).value}"
 
-    not_S = AnchorPoint.E | AnchorPoint.N | AnchorPoint.W
-    assert not_S.value != 0
-    assert (AnchorPoint.S & not_S).value == 0, f"AnchorPoint.S & not_S == {AnchorPoint.S & not_S} == {(AnchorPoint.S & not_S).value}"
 
-    not_W = AnchorPoint.E | AnchorPoint.S | AnchorPoint.N
-    assert not_W.value != 0
-    assert (AnchorPoint.W & not_W).value == 0, f"AnchorPoint.W & not_W == {AnchorPoint.W & not_W} == {(AnchorPoint.W & not_W).value}"
+def test_anchor_point_cardinal_distinct():
+    """
+    Test all defined AnchorPoint values.
 
-    assert len({AnchorPoint.N.value, AnchorPoint.E.value, AnchorPoint.S.value, AnchorPoint.W.value}) == 4
-    assert len({not_N.value, not_E.value, not_S.value, not_W.value}) == 4
+    REQ: The N, S, E, W cardinal direction labels each have distinct bits set from the others.
+    """
+    # The sum equals the bitwise 'or' only if no two labels share a bit - with no zero label, that makes the labels and their
+    # complements distinct too.
+    values = (_N.value, _E.value, _S.value, _W.value)
+    assert 0 not in values
+    assert sum(values) == (values[0] | values[1] | values[2] | values[3])
 
 
-def test_anchor_point_non_cardinal_combined_bits():
+@pytest.mark.parametrize("diagonal, vertical, horizontal", [
+    pytest.param(_SE, _S, _E, id="SE"),
+    pytest.param(_NE, _N, _E, id="NE"),
+    pytest.param(_NW, _N, _W, id="NW"),
+    pytest.param(_SW, _S, _W, id="SW"),
+])
+def test_anchor_point_non_cardinal_combined_bits(diagonal, vertical, horizontal):
     """
     Test all defined AnchorPoint values.
 
     REQ: THE NE, SE, SW, NW labels have distinct bitwise representations that are the bitwise 'or' of their cardinal direction representations.
     """
-    cardinal = {AnchorPoint.N, AnchorPoint.E, AnchorPoint.S, AnchorPoint.W}
-    diagonal = {AnchorPoint.NE, AnchorPoint.SE , AnchorPoint.SW , AnchorPoint.NW}
-    assert len(diagonal) == 4
-    assert len(diagonal - cardinal) == 4
-
-    assert AnchorPoint.SE == (AnchorPoint.S | AnchorPoint.E)
-    assert AnchorPoint.NE == (AnchorPoint.N | AnchorPoint.E)
-    assert AnchorPoint.NW == (AnchorPoint.N | AnchorPoint.W)
-    assert AnchorPoint.SW == (AnchorPoint.S | AnchorPoint.W)
+    assert diagonal not in (_N, _E, _S, _W)
+    assert diagonal == (vertical | horizontal)
 
 
 def test_anchor_point_combinations():
     """Test combining AnchorPoint flags."""
-    combined = AnchorPoint.N | AnchorPoint.E
-    assert combined == AnchorPoint.NE
-    combined = AnchorPoint.S | AnchorPoint.W
-    assert combined == AnchorPoint.SW
+    combined = _N | _E
+    assert combined == _NE
+    combined = _S | _W
+    assert combined == _SW
 
 def test_anchor_point_invalid_combination():
     """
@@ -115,38 +124,57 @@ def test_anchor_point_membership():
 
     REQ: The anchor point type provides an 'in' operator that tests for bits set in label representations.
     """
-    combined = AnchorPoint.N | AnchorPoint.S
-    assert AnchorPoint.N in combined
-    assert AnchorPoint.S in combined
-    assert AnchorPoint.E not in combined
-    assert AnchorPoint.NW not in combined
+    combined = _N | _S
+    assert _N in combined
+    assert _S in combined
+    assert _E not in combined
+    assert _NW not in combined
+
+
+def test_anchor_point_factors():
+    """
+    Test the placement factors behind each AnchorPoint value.
+
+    REQ: An anchor point yields the fraction of the leftover width and height to place left of and below an anchored extent.
+    REQ: W takes precedence over E and S takes precedence over N when a combined anchor point names both sides of an axis.
+    """
+    half = Fraction(1, 2)
+    assert AnchorPoint.CENTER.factors() == (half, half)
+    assert _N.factors() == (half, 1)
+    assert _SE.factors() == (1, 0)
+    assert _NW.factors() == (0, 1)
+    assert (_N | _S).factors() == (half, 0)
+    assert (_E | _W).factors() == (0, half)
 
 
 # Page Setting Tests ----------------------------------------------------------------------------------------------------------------------- #
 
 
-def test_page_settings_initialization():
+def test_page_settings_initialization(default_page_settings):
     """
     Test initialization of default PageSettings.
 
     REQ: The page settings type can be instantiated with no parameters using well-known default settings.
     """
-    settings = Page.factory().settings
-    assert settings.margins.left == settings.margins.right == settings.margins.top == settings.margins.bottom
-    assert settings.page_size.width > 0
-    assert settings.page_size.height > 0
+    margins = default_page_settings.margins
+    page_size = default_page_settings.page_size
+    assert margins.left == margins.right == margins.top == margins.bottom
+    assert page_size.width > 0
+    assert page_size.height > 0
 
-def test_page_settings_usable_area():
+def test_page_settings_usable_area(default_page_settings):
     """
     Test calculation of usable area based on margins.
 
     REQ: The page setting type has an extent property containing the usable page size which is the physical page size less the page margins.
     """
-    settings = Page.factory().settings
-    expected_width = settings.page_size.width - (settings.margins.left + settings.margins.right)
-    expected_height = settings.page_size.height - (settings.margins.top + settings.margins.bottom)
-    assert settings.printable_region.extent.width == expected_width
-    assert settings.printable_region.extent.height == expected_height
+    margins = default_page_settings.margins
+    page_size = default_page_settings.page_size
+    printable = default_page_settings.printable_region.extent
+    expected_width = page_size.width - (margins.left + margins.right)
+    expected_height = page_size.height - (margins.top + margins.bottom)
+    assert printable.width == expected_width
+    assert printable.height == expected_height
 
 
 # Paper Names Tests ------------------------------------------------------------------------------------------------------------------------ #
@@ -10,7 +10,9 @@ from kanji_time.visual.layout.distance import Distance
 from kanji_time.visual.layout.region import Extent
 
 
-#: .. todo:: pytest fixtures
+# Stack layout strategies hold no per-layout state - share one of each direction across the suite.
+_VLAYOUT = StackLayoutStrategy("vertical")
+_HLAYOUT = StackLayoutStrategy("horizontal")
 
 
 # Stack Layout Tests ----------------------------------------------------------------------------------------------------------------------- #
@@ -26,7 +28,8 @@ def test_bogus_stack_layout():
         _ = StackLayoutStrategy("diagonal")
 
 
-def test_vertical_stack_layout():
+@pytest.mark.parametrize("mult", [1, 2])
+def test_vertical_stack_layout(mult, sample_extents, fit_to_test):
     """
     Confirm vertical stack layouts.
 
@@ -38,29 +41,16 @@ def test_vertical_stack_layout():
     REQ: A stack layout type instance set to vertical distributes excess height evenly among all the extents with a height of "fit to"
          when the passed a maximum height argument is greater the measured height of the extents
     """
-
-    extents = [
-        Extent(Distance.parse("100pt"), Distance.parse("110pt")),
-        Extent(Distance.parse("*"), Distance.parse("220pt")),
-        Extent(Distance.parse("300pt"), Distance.parse("330pt")),
-        Extent(Distance.parse("400pt"), Distance.parse("*")),
-    ]
-    fit_to_test = Extent([1], [3])
-
-    vlayout = StackLayoutStrategy("vertical")
-    vertical_size = vlayout.measure(extents, fit_to_test)
+    vertical_size = _VLAYOUT.measure(sample_extents, fit_to_test)
     assert vertical_size == Extent(Distance.parse("400pt"), Distance.parse("660pt")), f"Unexpected vertical size = {vertical_size}."
 
-    consumed, vertical_regions = vlayout.layout(vertical_size, extents, fit_to_test)
-    assert consumed == vertical_size
-    assert vertical_regions[3].extent.height.pt == 0
-
-    consumed, vertical_regions = vlayout.layout(2*vertical_size, extents, fit_to_test)
-    assert consumed == 2*vertical_size
-    assert vertical_regions[3].extent.height.pt == vertical_size.height.pt
-
+    # At the measured size the "fit to" height collapses to zero; any excess goes to it.
+    consumed, vertical_regions = _VLAYOUT.layout(mult*vertical_size, sample_extents, fit_to_test)
+    assert consumed == mult*vertical_size
+    assert vertical_regions[3].extent.height.pt == (mult - 1)*vertical_size.height.pt
 
-def test_horizontal_stack_layout():
+@pytest.mark.parametrize("mult", [1, 2])
+def test_horizontal_stack_layout(mult, sample_extents, fit_to_test):
     """
     Confirm horizontal stack layouts.
 
@@ -72,21 +62,10 @@ def test_horizontal_stack_layout():
     REQ: A stack layout type instance set to horizontal distributes excess width evenly among all the extents with a width of "fit to"
          when the passed a maximum width argument is greater the measured width of the extents
     """
-
-    extents = [
-        Extent(Distance.parse("100pt"), Distance.parse("110pt")),
-        Extent(Distance.parse("*"), Distance.parse("220pt")),
-        Extent(Distance.parse("300pt"), Distance.parse("330pt")),
-        Extent(Distance.parse("400pt"), Distance.parse("*")),
-    ]
-    fit_to_test = Extent([1], [3])
-
-    hlayout = StackLayoutStrategy("horizontal")
-    horizontal_size = hlayout.measure(extents, fit_to_test)
+    horizontal_size = _HLAYOUT.measure(sample_extents, fit_to_test)
     assert horizontal_size == Extent(Distance.parse("800pt"), Distance.parse("330pt")), f"Unexpected horizontal size = {horizontal_size}."
-    consumed, horizontal_regions = hlayout.layout(horizontal_size, extents, fit_to_test)
-    assert consumed == horizontal_size
-    assert horizontal_regions[1].extent.width.pt == 0
-    consumed, horizontal_regions = hlayout.layout(2*horizontal_size, extents, fit_to_test)
-    assert consumed == 2*horizontal_size
-    assert horizontal_regions[1].extent.width.pt == horizontal_size.width.pt
+
+    # At the measured size the "fit to" width collapses to zero; any excess goes to it.
+    consumed, horizontal_regions = _HLAYOUT.layout(mult*horizontal_size, sample_extents, fit_to_test)
+    assert consumed == mult*horizontal_size
+    assert horizontal_regions[1].extent.width.pt == (mult - 1)*horizontal_size.width.pt
@@ -101,6 +101,10 @@ class States(enum.IntFlag):
     finished = 16 | 32 | 64 | 128
 
 
+# States members compare as ints - a plain int constant skips the enum member lookup on hot state checks.
+_NEEDS_LAYOUT = int(States.needs_layout)
+
+
 @runtime_checkable
 class RenderingFrame(Protocol):
     """
@@ -129,7 +133,7 @@ class RenderingFrame(Protocol):
 
     """
 
-    _requested_size: Extent
+    _requested_size: Extent  # coalesced when set: an empty request is stored as Extent.fit_to
     _layout_size: Extent
     content_size: Extent
     _state: States
@@ -142,22 +146,27 @@ class RenderingFrame(Protocol):
     @property
     def requested_size(self) -> Extent:
         """Yield the requested space to reserve for the framed content."""
-        # Extent.coalesce(dim) or coalesce(width, height) - Extent can be 0 and non-zero in each dim
-        return self._requested_size or Extent.fit_to  # why  not do this coalesce up front?
+        return self._requested_size
 
     @property
     def layout_size(self) -> Extent:
         """Yield the actual space (as computed during measure()) occupied by the framed content for layout."""
-        assert self.state >= States.needs_layout
+        assert self.state >= _NEEDS_LAYOUT
         return self._layout_size
 
     @property
     def is_stretchy(self) -> Extent:
         """Produce true if this content can be fit to some dimensions (linearly upward only)."""
-        return Extent(
-            self.requested_size is not None and (self.requested_size.width.at_least or self.requested_size.width.unit == "*"),
-            self.requested_size is not None and (self.requested_size.height.at_least or self.requested_size.height.unit == "*")
-        )
+        # Layout asks this several times per pass.  Extents are immutable, so remember the answer for the requested size it came from:
+        # any new size - through resize() or not - is a different instance and gets a fresh answer.
+        requested = self.requested_size
+        cached = getattr(self, '_stretchy_cache', None)
+        if cached is not None and cached[0] is requested:
+            return cached[1]
+        width, height = requested
+        stretchy = Extent(width.at_least or width.unit == "*", height.at_least or height.unit == "*")
+        self._stretchy_cache = (requested, stretchy)  # pylint: disable=attribute-defined-outside-init
+        return stretchy
 
     def __bool__(self) -> bool:
         """Produce true when this rendering frame has non-trivial content."""